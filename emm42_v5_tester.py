@@ -6,11 +6,23 @@ Comprehensive testing utility for the Emm42 V5.0 stepper motor plugin
 
 import sys
 import os
+import json
 import time
+import argparse
 import serial
 import threading
-from typing import Dict, Any, Optional, List, Tuple
+import functools
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Union
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional, the stdlib json module is used instead
+    orjson = None
 
 # Add the current directory to path to import local modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -18,6 +30,55 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from plugin_system import UARTPlugin, ChecksumCalculator, PluginManager
 
 
+# (success, sent frame, reply, exchange time in ns) for one command
+Outcome = Tuple[bool, bytes, Optional[bytes], int]
+
+# Plugins shared by every tester instance, loaded on first use
+_PLUGIN_CACHE: Dict[str, UARTPlugin] = {}
+_PLUGIN_CACHE_LOCK = threading.Lock()
+
+
+def _get_plugin(name: str) -> Optional[UARTPlugin]:
+    """Load a plugin once per process and hand out the shared instance"""
+    with _PLUGIN_CACHE_LOCK:
+        plugin = _PLUGIN_CACHE.get(name)
+        if plugin is None:
+            plugin_manager = PluginManager("plugins")
+            plugin_manager.load_plugin(name)
+            plugin = plugin_manager.get_plugin(name)
+            if plugin is not None:
+                _PLUGIN_CACHE[name] = plugin
+        return plugin
+
+
+def hex_bytes(data: bytes) -> str:
+    """Format bytes as space separated upper-case hex pairs"""
+    return data.hex(' ').upper()
+
+
+def json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _test_suite(suite):
+    """Stamp every result a run_* suite records with the suite's start time"""
+    @functools.wraps(suite)
+    def run(self, *args, **kwargs):
+        self._batch_timestamp = datetime.now().isoformat()
+        try:
+            return suite(self, *args, **kwargs)
+        finally:
+            # Results recorded outside a suite get their own timestamp
+            self._batch_timestamp = None
+    return run
+
+
 class MockSerial:
     """Mock serial interface for testing without hardware"""
     
@@ -25,8 +86,10 @@ class MockSerial:
         self.port = port
         self.baudrate = baudrate
         self.is_open = False
-        self.sent_data = []
-        self.response_queue = []
+        self.sent_data = deque(maxlen=1024)  # most recent frames only
+        self.response_queue = deque()
+        self._queued_bytes = 0  # unread bytes left in response_queue
+        self._head_offset = 0   # bytes of response_queue[0] already read
         print(f"[MockSerial] Created mock connection to {port} at {baudrate} baud")
     
     def open(self):
@@ -45,7 +108,7 @@ class MockSerial:
             raise Exception("Port not open")
         
         self.sent_data.append(data)
-        hex_str = ' '.join([f'{b:02X}' for b in data])
+        hex_str = hex_bytes(data)
         print(f"[MockSerial] SENT: {hex_str}")
         
         # Generate mock response based on command
@@ -55,109 +118,145 @@ class MockSerial:
             mock_response = self._generate_mock_response(addr, func, data)
             if mock_response:
                 self.response_queue.append(mock_response)
+                self._queued_bytes += len(mock_response)
         
         return len(data)
     
     def read(self, size: int = 1) -> bytes:
         """Read data from mock serial"""
+        buffer = bytearray(size)
+        n = self.readinto(buffer)
+        return bytes(buffer[:n])
+    
+    def readinto(self, buffer) -> int:
+        """Copy queued reply bytes straight into a caller-supplied buffer
+        
+        Like a real port this is a byte stream: a short buffer takes the
+        front of a reply and leaves the rest waiting for the next read.
+        """
         if not self.is_open:
             raise Exception("Port not open")
         
-        if self.response_queue:
-            response = self.response_queue.pop(0)
-            hex_str = ' '.join([f'{b:02X}' for b in response])
-            print(f"[MockSerial] RECV: {hex_str}")
-            return response
-        
-        return b''
+        n = 0
+        while n < len(buffer) and self.response_queue:
+            response = self.response_queue[0]
+            take = min(len(response) - self._head_offset, len(buffer) - n)
+            buffer[n:n + take] = response[self._head_offset:self._head_offset + take]
+            n += take
+            self._head_offset += take
+            if self._head_offset == len(response):
+                self.response_queue.popleft()
+                self._head_offset = 0
+                print(f"[MockSerial] RECV: {hex_bytes(response)}")
+        self._queued_bytes -= n
+        return n
     
+    @property
     def in_waiting(self) -> int:
-        """Return number of bytes waiting"""
-        return len(self.response_queue) > 0
+        """Return number of bytes waiting, like serial.Serial.in_waiting"""
+        return self._queued_bytes
+    
+    def reset_input_buffer(self):
+        """Discard unread reply bytes, like serial.Serial.reset_input_buffer"""
+        self.response_queue.clear()
+        self._queued_bytes = 0
+        self._head_offset = 0
+    
+    # Function codes answered with a plain success frame
+    _SUCCESS_FUNCS = frozenset({
+        0xF3, 0xF6, 0xFD, 0xFE, 0xFF, 0x93, 0x9A, 0x9C,
+        0x06, 0x0A, 0x0E, 0x0F, 0x84, 0xAE, 0x46, 0x44,
+        0x4C, 0xF7, 0x4F
+    })
+    
+    # Read commands: payload + checksum that follows the address/function prefix
+    _READ_TEMPLATES = {
+        0x31: bytes([0x1A, 0x2B, 0x6B]),                          # Read encoder value - Mock encoder: 6699
+        0x32: bytes([0x00, 0x00, 0x03, 0x20, 0x00, 0x6B]),        # Read input pulses - Mock: +800 pulses
+        0x33: bytes([0x00, 0x00, 0x0C, 0x80, 0x00, 0x6B]),        # Read target position - Mock: +3200 position
+        0x34: bytes([0x00, 0x00, 0x0C, 0x80, 0x00, 0x6B]),        # Read realtime target - Mock: +3200 target
+        0x35: bytes([0x00, 0x00, 0x64, 0x6B]),                    # Read realtime speed - Mock: +100 RPM
+        0x36: bytes([0x00, 0x00, 0x0C, 0x80, 0x00, 0x6B]),        # Read realtime position - Mock: +3200 position
+        0x37: bytes([0x00, 0x00, 0x00, 0x05, 0x00, 0x6B]),        # Read position error - Mock: +5 error
+        0x3A: bytes([0x03, 0x6B]),                                # Read motor status - Mock: Enabled + In Position
+        0x3B: bytes([0x03, 0x6B]),                                # Read homing status - Mock: Encoder Ready + Table Ready
+        0x1F: bytes([0x20, 0x15, 0x6B]),                          # Read firmware version - Mock: FW 0x20, HW 0x15
+        0x20: bytes([0x01, 0x2C, 0x00, 0x64, 0x6B]),              # Read motor parameters - Mock: 300mΩ, 100uH
+        0x21: bytes([0x00, 0x00, 0x00, 0x64,                      # Read PID parameters - Kp: 100
+                     0x00, 0x00, 0x00, 0x32,                      #                       Ki: 50
+                     0x00, 0x00, 0x00, 0x0A, 0x6B]),              #                       Kd: 10
+        0x24: bytes([0x2E, 0xE0, 0x6B]),                          # Read bus voltage - Mock: 12V (12000mV)
+        0x27: bytes([0x03, 0xE8, 0x6B]),                          # Read phase current - Mock: 1000mA
+        0x42: bytes([0x10, 0x02, 0x01, 0x6B]),                    # Read drive config - Mock config
+        0x43: bytes([0x00, 0x01, 0x6B]),                          # Read system status - Mock system status
+    }
     
     def _generate_mock_response(self, addr: int, func: int, command: bytes) -> bytes:
         """Generate mock responses for testing"""
         # Standard success response
-        if func in [0xF3, 0xF6, 0xFD, 0xFE, 0xFF, 0x93, 0x9A, 0x9C, 
-                   0x06, 0x0A, 0x0E, 0x0F, 0x84, 0xAE, 0x46, 0x44, 
-                   0x4C, 0xF7, 0x4F]:
-            return bytes([addr, func, 0x02, 0x6B])  # Success response
+        if func in self._SUCCESS_FUNCS:
+            return bytes((addr, func, 0x02, 0x6B))
         
         # Read commands with data
-        elif func == 0x31:  # Read encoder value
-            return bytes([addr, func, 0x1A, 0x2B, 0x6B])  # Mock encoder: 6699
-        
-        elif func == 0x32:  # Read input pulses  
-            return bytes([addr, func, 0x00, 0x00, 0x03, 0x20, 0x00, 0x6B])  # Mock: +800 pulses
-        
-        elif func == 0x33:  # Read target position
-            return bytes([addr, func, 0x00, 0x00, 0x0C, 0x80, 0x00, 0x6B])  # Mock: +3200 position
-        
-        elif func == 0x34:  # Read realtime target
-            return bytes([addr, func, 0x00, 0x00, 0x0C, 0x80, 0x00, 0x6B])  # Mock: +3200 target
-        
-        elif func == 0x35:  # Read realtime speed
-            return bytes([addr, func, 0x00, 0x00, 0x64, 0x6B])  # Mock: +100 RPM
-        
-        elif func == 0x36:  # Read realtime position
-            return bytes([addr, func, 0x00, 0x00, 0x0C, 0x80, 0x00, 0x6B])  # Mock: +3200 position
-        
-        elif func == 0x37:  # Read position error
-            return bytes([addr, func, 0x00, 0x00, 0x00, 0x05, 0x00, 0x6B])  # Mock: +5 error
-        
-        elif func == 0x3A:  # Read motor status
-            return bytes([addr, func, 0x03, 0x6B])  # Mock: Enabled + In Position
-        
-        elif func == 0x3B:  # Read homing status
-            return bytes([addr, func, 0x03, 0x6B])  # Mock: Encoder Ready + Table Ready
-        
-        elif func == 0x1F:  # Read firmware version
-            return bytes([addr, func, 0x20, 0x15, 0x6B])  # Mock: FW 0x20, HW 0x15
+        template = self._READ_TEMPLATES.get(func)
+        if template is not None:
+            return bytes((addr, func)) + template
         
-        elif func == 0x20:  # Read motor parameters
-            return bytes([addr, func, 0x01, 0x2C, 0x00, 0x64, 0x6B])  # Mock: 300mΩ, 100uH
-        
-        elif func == 0x21:  # Read PID parameters
-            pid_data = [0x00, 0x00, 0x00, 0x64,  # Kp: 100
-                       0x00, 0x00, 0x00, 0x32,  # Ki: 50
-                       0x00, 0x00, 0x00, 0x0A]  # Kd: 10
-            return bytes([addr, func] + pid_data + [0x6B])
-        
-        elif func == 0x24:  # Read bus voltage
-            return bytes([addr, func, 0x2E, 0xE0, 0x6B])  # Mock: 12V (12000mV)
-        
-        elif func == 0x27:  # Read phase current
-            return bytes([addr, func, 0x03, 0xE8, 0x6B])  # Mock: 1000mA
-        
-        elif func == 0x42:  # Read drive config
-            return bytes([addr, func, 0x10, 0x02, 0x01, 0x6B])  # Mock config
-        
-        elif func == 0x43:  # Read system status
-            return bytes([addr, func, 0x00, 0x01, 0x6B])  # Mock system status
-        
-        else:
-            # Unknown command error
-            return bytes([addr, 0x00, 0xEE, 0x6B])
+        # Unknown command error
+        return bytes((addr, 0x00, 0xEE, 0x6B))
 
 
 class Emm42V5Tester:
     """Comprehensive tester for Emm42 V5.0 plugin"""
     
-    def __init__(self, use_mock: bool = True):
+    RESPONSE_TIMEOUT = 1.0  # seconds to wait for the first reply byte
+    QUIET_CHARS = 3.5       # silence, in character times, that ends a reply
+    RX_BUFFER_SIZE = 256    # upper bound for a single reply frame
+    
+    # Fields kept in memory per test when full results are streamed to disk
+    _SUMMARY_KEYS = ("command", "success", "error", "human_readable")
+    
+    def __init__(self, use_mock: bool = True, results_stream: Optional[str] = None,
+                 parallel_addresses: bool = False):
         self.use_mock = use_mock
+        self.parallel_addresses = parallel_addresses
         self.serial_conn: Optional[serial.Serial] = None
         self.plugin: Optional[UARTPlugin] = None
         self.test_results: List[Dict[str, Any]] = []
         
+        # Compact per-test metrics, index-aligned with test_results
+        self._command_ids: Dict[str, int] = {}
+        self._stat_success = array('B')
+        self._stat_command = array('H')
+        self._stat_elapsed_ns = array('Q')
+        
+        # Optionally write every full result to an NDJSON file as it is
+        # produced, keeping only summary rows in test_results. The file is
+        # opened on the first result and closed by disconnect_serial()
+        self._results_path = results_stream
+        self._results_fp = None
+        self._results_started = False  # file created; later opens append
+        
+        # Replies are received in place into one reused buffer and copied
+        # out as bytes, so callers may keep them
+        self._rx_buffer = memoryview(bytearray(self.RX_BUFFER_SIZE))
+        
+        self._quiet_gap = 0.002
+        
+        # Timestamp shared by every result of the suite that is running
+        self._batch_timestamp: Optional[str] = None
+        
+        # One exchange owns the port at a time; results are appended as a unit
+        self._io_lock = threading.Lock()
+        self._results_lock = threading.Lock()
+        
         # Load the plugin
         self._load_plugin()
     
     def _load_plugin(self):
         """Load the Emm42 V5.0 plugin"""
         try:
-            plugin_manager = PluginManager("plugins")
-            plugin_manager.load_plugin("emm42_v5")
-            self.plugin = plugin_manager.get_plugin("emm42_v5")
+            self.plugin = _get_plugin("emm42_v5")
             
             if self.plugin:
                 print(f"[Plugin] Loaded: {self.plugin.name}")
@@ -174,11 +273,16 @@ class Emm42V5Tester:
         """Connect to serial port or create mock connection"""
         try:
             if self.use_mock:
-                self.serial_conn = MockSerial(port, baudrate, timeout=1)
+                self.serial_conn = MockSerial(port, baudrate, timeout=self.RESPONSE_TIMEOUT)
             else:
-                self.serial_conn = serial.Serial(port, baudrate, timeout=1)
+                self.serial_conn = serial.Serial(port, baudrate, timeout=self.RESPONSE_TIMEOUT)
             
-            self.serial_conn.open()
+            # Replies of unknown length end once the line stays quiet this
+            # long (10 bits per character)
+            self._quiet_gap = max(0.002, self.QUIET_CHARS * 10.0 / baudrate)
+            
+            if not self.serial_conn.is_open:
+                self.serial_conn.open()
             print(f"[Serial] Connected to {port} at {baudrate} baud")
             return True
             
@@ -188,40 +292,123 @@ class Emm42V5Tester:
     
     def disconnect_serial(self):
         """Disconnect from serial port"""
+        self._close_results_stream()
         if self.serial_conn and self.serial_conn.is_open:
             self.serial_conn.close()
             print("[Serial] Disconnected")
     
+    def _write_result_line(self, test_result: Dict[str, Any]):
+        """Append one full result to the NDJSON stream, opening it on first use"""
+        if self._results_fp is None:
+            self._results_fp = open(self._results_path, 'ab' if self._results_started else 'wb')
+            self._results_started = True
+        self._results_fp.write(json_bytes(test_result) + b'\n')
+    
+    def _close_results_stream(self):
+        """Flush and close the NDJSON stream, if one is open"""
+        if self._results_fp is not None:
+            self._results_fp.close()
+            self._results_fp = None
+    
+    def remove_results_stream(self):
+        """Close and delete the NDJSON stream once a report has been built from it"""
+        self._close_results_stream()
+        if self._results_path is not None and self._results_started:
+            try:
+                os.remove(self._results_path)
+            except FileNotFoundError:
+                pass
+            self._results_started = False
+    
+    def _exchange(self, cmd_bytes: bytes, command: str) -> Optional[bytes]:
+        """Write one frame and block until its reply arrives"""
+        conn = self.serial_conn
+        with self._io_lock:
+            # Drop leftovers of an earlier reply so they cannot shift this one
+            conn.reset_input_buffer()
+            conn.write(cmd_bytes)
+            
+            # Block on the port until the reply arrives (or RESPONSE_TIMEOUT
+            # expires); the driver waits on the fd, so there is no sleep/poll.
+            # With a known reply length, read a status frame's worth first:
+            # a rejected command stops there, and each read asks for exactly
+            # the bytes still to come, so it returns as soon as they are in
+            # rather than at the timeout.
+            buffer = self._rx_buffer
+            expected_len = self.plugin.expected_response_len(command)
+            if expected_len:
+                status_len = self.plugin.status_reply_length
+                n = conn.readinto(buffer[:min(expected_len, status_len)])
+                
+                # A data reply can begin like a status frame; it is only
+                # taken as one if nothing follows within the quiet gap
+                if n == status_len < expected_len and not (
+                        self.plugin.is_status_frame(buffer[:n]) and self._line_quiet()):
+                    n += conn.readinto(buffer[n:expected_len])
+            else:
+                n = self._read_until_quiet(buffer)
+            
+            # Copy out while the port is still ours; the buffer is reused
+            return bytes(buffer[:n]) if n else None
+    
+    def _line_quiet(self) -> bool:
+        """Return True if no further bytes arrive within the quiet gap"""
+        if self.serial_conn.in_waiting:
+            return False
+        time.sleep(self._quiet_gap)
+        return not self.serial_conn.in_waiting
+    
+    def _read_until_quiet(self, buffer: memoryview) -> int:
+        """Receive a reply of unknown length into buffer, returning its size
+        
+        Only the first byte waits for RESPONSE_TIMEOUT. After that, bytes
+        are taken as they become available until the line has been quiet
+        for _quiet_gap, so the read never sits out the full timeout.
+        """
+        conn = self.serial_conn
+        n = conn.readinto(buffer[:1])
+        while n and n < len(buffer):
+            waiting = conn.in_waiting
+            if not waiting:
+                time.sleep(self._quiet_gap)
+                waiting = conn.in_waiting
+                if not waiting:
+                    break
+            n += conn.readinto(buffer[n:n + waiting])
+        return n
+    
+    def _build_frame(self, command: str, parameters: Dict[str, Any]) -> bytes:
+        """Build a command frame; the plugin caches repeated parameter sets"""
+        return self.plugin.process_command(command, parameters)
+    
     def send_command(self, command: str, parameters: Dict[str, Any]) -> Tuple[bool, bytes, Optional[bytes]]:
         """Send a command and get response"""
+        return self._send_command(command, parameters)[:3]
+    
+    def _send_command(self, command: str, parameters: Dict[str, Any]) -> Outcome:
+        """Build and send a command, timing the exchange"""
         try:
             # Process command with plugin
-            cmd_bytes = self.plugin.process_command(command, parameters)
-            
-            if not self.serial_conn or not self.serial_conn.is_open:
-                print("[ERROR] Serial connection not available")
-                return False, cmd_bytes, None
-            
-            # Send command
-            self.serial_conn.write(cmd_bytes)
-            
-            # Wait for response
-            time.sleep(0.1)
-            response = b''
-            
-            # Read response (timeout after 1 second)
-            start_time = time.time()
-            while time.time() - start_time < 1.0:
-                if self.serial_conn.in_waiting() > 0:
-                    response = self.serial_conn.read(self.serial_conn.in_waiting())
-                    break
-                time.sleep(0.01)
-            
-            return True, cmd_bytes, response if response else None
-            
+            cmd_bytes = self._build_frame(command, parameters)
+        except Exception as e:
+            print(f"[ERROR] Command execution failed: {e}")
+            return False, b'', None, 0
+        
+        if not self.serial_conn or not self.serial_conn.is_open:
+            print("[ERROR] Serial connection not available")
+            return False, cmd_bytes, None, 0
+        
+        return self._send_frame(cmd_bytes, command)
+    
+    def _send_frame(self, cmd_bytes: bytes, command: str) -> Outcome:
+        """Send an already built frame on the open port and get response"""
+        try:
+            start = time.perf_counter_ns()
+            response = self._exchange(cmd_bytes, command)
+            return True, cmd_bytes, response, time.perf_counter_ns() - start
         except Exception as e:
             print(f"[ERROR] Command execution failed: {e}")
-            return False, b'', None
+            return False, b'', None, 0
     
     def test_command(self, command: str, parameters: Dict[str, Any] = None) -> Dict[str, Any]:
         """Test a single command and return results"""
@@ -231,10 +418,76 @@ class Emm42V5Tester:
         print(f"\n[TEST] Testing command: {command}")
         print(f"[TEST] Parameters: {parameters}")
         
+        return self._record_result(command, parameters, self._send_command(command, parameters))
+    
+    def test_command_precompiled(self, cmd_bytes: bytes, command: str,
+                                 parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Test a frame that was built ahead of time, skipping the plugin"""
+        print(f"\n[TEST] Testing command: {command}")
+        print(f"[TEST] Parameters: {parameters}")
+        
+        if not self.serial_conn or not self.serial_conn.is_open:
+            print("[ERROR] Serial connection not available")
+            outcome = (False, cmd_bytes, None, 0)
+        else:
+            outcome = self._send_frame(cmd_bytes, command)
+        
+        return self._record_result(command, parameters, outcome)
+    
+    def test_command_batch(self, cmds: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Test a list of (command, parameters) pairs as one back-to-back sequence"""
+        # Build every frame before touching the bus so the write/read
+        # round trips follow each other with no plugin work in between
+        frames: List[Union[bytes, Exception]] = []
+        for command, parameters in cmds:
+            try:
+                frames.append(self._build_frame(command, parameters))
+            except Exception as e:
+                frames.append(e)
+        
+        connected = bool(self.serial_conn and self.serial_conn.is_open)
+        
+        # The bus is half-duplex, so exchanges stay strictly ordered. Each
+        # exchange is printed under its own header as it happens; only
+        # parsing and recording the results waits for the batch to finish
+        outcomes: List[Outcome] = []
+        for (command, parameters), frame in zip(cmds, frames):
+            print(f"\n[TEST] Testing command: {command}")
+            print(f"[TEST] Parameters: {parameters}")
+            if isinstance(frame, Exception):
+                print(f"[ERROR] Command execution failed: {frame}")
+                outcome = (False, b'', None, 0)
+            elif not connected:
+                print("[ERROR] Serial connection not available")
+                outcome = (False, frame, None, 0)
+            else:
+                outcome = self._send_frame(frame, command)
+            self._print_exchange(outcome)
+            outcomes.append(outcome)
+        
+        return [self._record_result(command, parameters, outcome, echo=False)
+                for (command, parameters), outcome in zip(cmds, outcomes)]
+    
+    def _print_exchange(self, outcome: Outcome):
+        """Print the frames of one exchange the way _record_result does"""
+        _, sent_bytes, received_bytes, _ = outcome
+        if received_bytes:
+            print(f"[TEST] Sent: {hex_bytes(sent_bytes)}")
+            print(f"[TEST] Received: {hex_bytes(received_bytes)}")
+        else:
+            print(f"[TEST] No response received")
+    
+    def _record_result(self, command: str, parameters: Dict[str, Any],
+                       outcome: Outcome, echo: bool = True) -> Dict[str, Any]:
+        """Parse a send outcome into a test result and store it
+        
+        With echo False the exchange has already been printed, so only a
+        parse error is reported, tagged with its command.
+        """
         test_result = {
             "command": command,
             "parameters": parameters.copy(),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._batch_timestamp or datetime.now().isoformat(),
             "success": False,
             "sent_bytes": "",
             "received_bytes": "",
@@ -244,74 +497,93 @@ class Emm42V5Tester:
         }
         
         try:
-            # Send command
-            success, sent_bytes, received_bytes = self.send_command(command, parameters)
+            success, sent_bytes, received_bytes, _ = outcome
             
-            test_result["sent_bytes"] = ' '.join([f'{b:02X}' for b in sent_bytes])
+            test_result["sent_bytes"] = hex_bytes(sent_bytes)
             
             if received_bytes:
-                test_result["received_bytes"] = ' '.join([f'{b:02X}' for b in received_bytes])
+                test_result["received_bytes"] = hex_bytes(received_bytes)
                 
-                # Parse response with plugin
-                parsed = self.plugin.parse_response(received_bytes)
+                # Parse response with plugin, in a single call when the
+                # plugin can produce both views of the frame at once
+                parse_and_format = getattr(self.plugin, 'parse_and_format', None)
+                if parse_and_format is not None:
+                    parsed, test_result["human_readable"] = parse_and_format(received_bytes)
+                else:
+                    parsed = self.plugin.parse_response(received_bytes)
+                    
+                    # Get human-readable response if plugin supports it
+                    if hasattr(self.plugin, 'response_to_human_readable'):
+                        test_result["human_readable"] = self.plugin.response_to_human_readable(received_bytes)
                 test_result["parsed_response"] = parsed
                 
-                # Get human-readable response if plugin supports it
-                if hasattr(self.plugin, 'response_to_human_readable'):
-                    test_result["human_readable"] = self.plugin.response_to_human_readable(received_bytes)
-                
                 test_result["success"] = success
                 
-                print(f"[TEST] Sent: {test_result['sent_bytes']}")
-                print(f"[TEST] Received: {test_result['received_bytes']}")
-                if test_result["human_readable"]:
-                    print(f"[TEST] Human readable: {test_result['human_readable']}")
+                if echo:
+                    print(f"[TEST] Sent: {test_result['sent_bytes']}")
+                    print(f"[TEST] Received: {test_result['received_bytes']}")
+                    if test_result["human_readable"]:
+                        print(f"[TEST] Human readable: {test_result['human_readable']}")
             
             else:
                 test_result["error"] = "No response received"
-                print(f"[TEST] No response received")
+                if echo:
+                    print(f"[TEST] No response received")
         
         except Exception as e:
             test_result["error"] = str(e)
-            print(f"[TEST] Error: {e}")
+            print(f"[TEST] Error: {e}" if echo else f"[TEST] Error ({command}): {e}")
         
-        self.test_results.append(test_result)
+        with self._results_lock:
+            self._stat_success.append(test_result["success"])
+            self._stat_command.append(self._command_ids.setdefault(command, len(self._command_ids)))
+            self._stat_elapsed_ns.append(outcome[3])
+            
+            if self._results_path is not None:
+                self._write_result_line(test_result)
+                self.test_results.append({key: test_result[key] for key in self._SUMMARY_KEYS})
+            else:
+                self.test_results.append(test_result)
         return test_result
     
+    @_test_suite
     def run_basic_tests(self):
         """Run basic functionality tests"""
         print("\n" + "="*60)
         print("RUNNING BASIC FUNCTIONALITY TESTS")
         print("="*60)
         
-        # Test motor enable/disable
-        self.test_command("motor_enable", {"address": 1, "enable": "Enable", "sync": "No"})
-        self.test_command("motor_enable", {"address": 1, "enable": "Disable", "sync": "No"})
-        
-        # Test speed mode
-        self.test_command("speed_mode", {
-            "address": 1, "direction": "CW", "speed": 100, 
-            "acceleration": 10, "sync": "No"
-        })
-        
-        # Test position mode
-        self.test_command("position_mode", {
-            "address": 1, "direction": "CW", "speed": 100, 
-            "acceleration": 10, "pulses": 3200, "mode": "Relative", "sync": "No"
-        })
-        
-        # Test immediate stop
-        self.test_command("immediate_stop", {"address": 1, "sync": "No"})
-        
-        # Test homing
-        self.test_command("trigger_homing", {"address": 1, "mode": "Nearest", "sync": "No"})
-        self.test_command("stop_homing", {"address": 1})
-        
-        # Test calibration and reset commands
-        self.test_command("calibrate_encoder", {"address": 1})
-        self.test_command("clear_position", {"address": 1})
-        self.test_command("set_zero_position", {"address": 1, "save": "Yes"})
+        self.test_command_batch([
+            # Test motor enable/disable
+            ("motor_enable", {"address": 1, "enable": "Enable", "sync": "No"}),
+            ("motor_enable", {"address": 1, "enable": "Disable", "sync": "No"}),
+            
+            # Test speed mode
+            ("speed_mode", {
+                "address": 1, "direction": "CW", "speed": 100, 
+                "acceleration": 10, "sync": "No"
+            }),
+            
+            # Test position mode
+            ("position_mode", {
+                "address": 1, "direction": "CW", "speed": 100, 
+                "acceleration": 10, "pulses": 3200, "mode": "Relative", "sync": "No"
+            }),
+            
+            # Test immediate stop
+            ("immediate_stop", {"address": 1, "sync": "No"}),
+            
+            # Test homing
+            ("trigger_homing", {"address": 1, "mode": "Nearest", "sync": "No"}),
+            ("stop_homing", {"address": 1}),
+            
+            # Test calibration and reset commands
+            ("calibrate_encoder", {"address": 1}),
+            ("clear_position", {"address": 1}),
+            ("set_zero_position", {"address": 1, "save": "Yes"}),
+        ])
     
+    @_test_suite
     def run_read_tests(self):
         """Run read command tests"""
         print("\n" + "="*60)
@@ -337,9 +609,9 @@ class Emm42V5Tester:
             "read_system_status"
         ]
         
-        for cmd in read_commands:
-            self.test_command(cmd, {"address": 1})
+        self.test_command_batch([(cmd, {"address": 1}) for cmd in read_commands])
     
+    @_test_suite
     def run_modify_tests(self):
         """Run modify parameter tests"""
         print("\n" + "="*60)
@@ -371,6 +643,7 @@ class Emm42V5Tester:
             "address": 1, "save": "Yes", "scale_enable": "Enable"
         })
     
+    @_test_suite
     def run_checksum_tests(self):
         """Run tests with different checksum types"""
         print("\n" + "="*60)
@@ -386,23 +659,46 @@ class Emm42V5Tester:
                 "checksum_type": checksum_type
             })
     
-    def run_stress_tests(self):
-        """Run stress tests with rapid commands"""
+    @_test_suite
+    def run_stress_tests(self, stress_delay: Optional[float] = None):
+        """Run stress tests with rapid commands
+        
+        Each exchange already waits for the drive's reply, so commands
+        pace themselves; stress_delay adds an extra pause between them on
+        real hardware (ignored against the mock).
+        """
         print("\n" + "="*60)
         print("RUNNING STRESS TESTS")
         print("="*60)
         
-        # Rapid enable/disable cycles
-        for i in range(5):
-            self.test_command("motor_enable", {"address": 1, "enable": "Enable"})
-            time.sleep(0.05)
-            self.test_command("motor_enable", {"address": 1, "enable": "Disable"})
-            time.sleep(0.05)
+        # Rapid enable/disable cycles, frames built once outside the loop
+        enable_params = {"address": 1, "enable": "Enable"}
+        disable_params = {"address": 1, "enable": "Disable"}
+        enable_frame = self._build_frame("motor_enable", enable_params)
+        disable_frame = self._build_frame("motor_enable", disable_params)
+        
+        delay = stress_delay if stress_delay and not self.use_mock else None
         
-        # Multiple address tests
-        for addr in range(1, 4):
-            self.test_command("read_motor_status", {"address": addr})
+        for i in range(5):
+            self.test_command_precompiled(enable_frame, "motor_enable", enable_params)
+            if delay:
+                time.sleep(delay)
+            self.test_command_precompiled(disable_frame, "motor_enable", disable_params)
+            if delay:
+                time.sleep(delay)
+        
+        # Multiple address tests; addresses share no state, so they can
+        # be driven from separate workers (the port itself still serializes)
+        addresses = range(1, 4)
+        if self.parallel_addresses:
+            with ThreadPoolExecutor(max_workers=len(addresses)) as pool:
+                list(pool.map(lambda addr: self.test_command("read_motor_status", {"address": addr}),
+                              addresses))
+        else:
+            for addr in addresses:
+                self.test_command("read_motor_status", {"address": addr})
     
+    @_test_suite
     def run_custom_command_tests(self):
         """Run custom command tests"""
         print("\n" + "="*60)
@@ -451,8 +747,8 @@ class Emm42V5Tester:
         print("TEST SUMMARY")
         print("="*60)
         
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result["success"])
+        total_tests = len(self._stat_success)
+        passed_tests = sum(self._stat_success)
         failed_tests = total_tests - passed_tests
         
         print(f"Total tests run: {total_tests}")
@@ -460,12 +756,14 @@ class Emm42V5Tester:
         print(f"Failed: {failed_tests}")
         print(f"Success rate: {(passed_tests/total_tests)*100:.1f}%")
         print(f"Duration: {duration:.2f} seconds")
+        if total_tests:
+            print(f"Average exchange time: {sum(self._stat_elapsed_ns) / total_tests / 1e6:.2f} ms")
         
         if failed_tests > 0:
             print(f"\nFAILED TESTS:")
-            for result in self.test_results:
-                if not result["success"]:
-                    print(f"  - {result['command']}: {result.get('error', 'Unknown error')}")
+            for index in [i for i, ok in enumerate(self._stat_success) if not ok]:
+                result = self.test_results[index]
+                print(f"  - {result['command']}: {result.get('error', 'Unknown error')}")
         
         print(f"\nDETAILED RESULTS:")
         for i, result in enumerate(self.test_results, 1):
@@ -480,30 +778,45 @@ class Emm42V5Tester:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"emm42_v5_test_report_{timestamp}.json"
         
-        import json
-        
-        report_data = {
-            "test_info": {
-                "plugin_name": self.plugin.name if self.plugin else "Unknown",
-                "test_mode": "Mock Hardware" if self.use_mock else "Real Hardware",
-                "timestamp": datetime.now().isoformat(),
-                "total_tests": len(self.test_results),
-                "passed_tests": sum(1 for r in self.test_results if r["success"]),
-                "failed_tests": sum(1 for r in self.test_results if not r["success"])
-            },
-            "test_results": self.test_results
+        test_info = {
+            "plugin_name": self.plugin.name if self.plugin else "Unknown",
+            "test_mode": "Mock Hardware" if self.use_mock else "Real Hardware",
+            "timestamp": datetime.now().isoformat(),
+            "total_tests": len(self._stat_success),
+            "passed_tests": sum(self._stat_success),
+            "failed_tests": len(self._stat_success) - sum(self._stat_success)
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        if self._results_path is not None:
+            # Results are already serialized, so only wrap them. The stream
+            # reopens in append mode if more results follow, so the file
+            # keeps every row and a later report includes them all
+            self._close_results_stream()
+            if not self._results_started:
+                Path(self._results_path).touch()
+                self._results_started = True
+            
+            with open(self._results_path, 'rb') as src, open(filename, 'wb') as f:
+                f.write(b'{"test_info": ' + json_bytes(test_info))
+                f.write(b', "test_results": [')
+                separator = b'\n'
+                for line in src:
+                    f.write(separator + line.rstrip(b'\n'))
+                    separator = b',\n'
+                f.write(b'\n]}\n')
+        else:
+            report_data = {
+                "test_info": test_info,
+                "test_results": self.test_results
+            }
+            
+            Path(filename).write_bytes(json_bytes(report_data, indent=True))
         
         print(f"[REPORT] Detailed test report saved to: {filename}")
 
 
 def main():
     """Main function"""
-    import argparse
-    
     parser = argparse.ArgumentParser(description="Emm42 V5.0 Plugin Tester")
     parser.add_argument("--port", default="COM3", help="Serial port (default: COM3)")
     parser.add_argument("--baudrate", type=int, default=9600, help="Baud rate (default: 9600)")
@@ -511,11 +824,18 @@ def main():
     parser.add_argument("--save-report", action="store_true", help="Save detailed test report")
     parser.add_argument("--test-single", help="Test single command only")
     parser.add_argument("--address", type=int, default=1, help="Device address (default: 1)")
+    parser.add_argument("--parallel-addresses", action="store_true",
+                        help="Run per-address stress tests from a thread pool")
     
     args = parser.parse_args()
     
-    # Create tester
-    tester = Emm42V5Tester(use_mock=not args.real_hardware)
+    # Create tester, streaming full results to disk when a report is wanted
+    results_stream = None
+    if args.save_report:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        results_stream = f"emm42_v5_test_results_{timestamp}.ndjson"
+    tester = Emm42V5Tester(use_mock=not args.real_hardware, results_stream=results_stream,
+                           parallel_addresses=args.parallel_addresses)
     
     # Connect to serial
     if not tester.connect_serial(args.port, args.baudrate):
@@ -533,6 +853,9 @@ def main():
         
         if args.save_report:
             tester.save_test_report()
+            # The report holds every result; the stream was only scratch.
+            # If anything above raised, it is kept as the only record
+            tester.remove_results_stream()
         
     finally:
         tester.disconnect_serial()
@@ -7,13 +7,51 @@ Base classes and plugin manager for extending functionality
 import os
 import sys
 import importlib.util
+import operator
+import string
+from functools import reduce, lru_cache
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Callable
+from types import ModuleType
+from typing import Dict, List, Any, Optional, Callable, Tuple, FrozenSet, Union
 import json
 
 
+# Buffers the checksum helpers accept without copying
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+@lru_cache(maxsize=8)
+def _crc8_table(poly: int) -> Tuple[int, ...]:
+    """Return the 256-entry CRC-8 table for a polynomial, built once per polynomial"""
+    entries = []
+    for crc in range(256):
+        for _ in range(8):
+            if crc & 0x80:
+                crc = (crc << 1) ^ poly
+            else:
+                crc <<= 1
+            crc &= 0xFF
+        entries.append(crc)
+    return tuple(entries)
+
+
+# Build the default table at import so the first frame doesn't pay for it
+_crc8_table(0x07)
+
+# File mtime each plugin module in sys.modules was executed from, so any
+# PluginManager can reuse a module whose file has not changed
+_module_mtimes: Dict[str, float] = {}
+
+
 class UARTPlugin(ABC):
-    """Base class for UART plugins"""
+    """Base class for UART plugins
+    
+    The base attributes live in __slots__. Subclasses that don't declare
+    __slots__ keep a normal __dict__ for their own attributes; subclasses
+    that do must list every extra attribute they set.
+    """
+    
+    __slots__ = ('name', 'description', 'enabled')
     
     def __init__(self, name: str, description: str):
         self.name = name
@@ -46,6 +84,10 @@ class UARTPlugin(ABC):
     def validate_parameters(self, command: str, parameters: Dict[str, Any]) -> bool:
         """Validate command parameters (override in subclass if needed)"""
         return True
+    
+    def expected_response_len(self, command: str) -> Optional[int]:
+        """Return the reply length in bytes for a command, or None if it varies (override in subclass if needed)"""
+        return None
 
 
 class PluginManager:
@@ -54,8 +96,15 @@ class PluginManager:
     def __init__(self, plugin_directory: str = "plugins"):
         self.plugin_directory = plugin_directory
         self.plugins: Dict[str, UARTPlugin] = {}
+        self._enabled_plugins: Dict[str, UARTPlugin] = {}  # enabled subset of plugins
+        # Bound (validate_parameters, process_command, parse_response) of each
+        # enabled plugin, resolved once instead of on every dispatch
+        self._handlers: Dict[str, Tuple[Callable, Callable, Callable]] = {}
         self.callbacks: Dict[str, Callable] = {}
         
+        # Plugin directory mtime and plugin names seen by the last scan
+        self._dir_snapshot: Optional[Tuple[float, FrozenSet[str]]] = None
+        
         # Ensure plugin directory exists
         os.makedirs(plugin_directory, exist_ok=True)
         
@@ -70,27 +119,69 @@ class PluginManager:
     
     def load_plugins(self):
         """Load all plugins from the plugin directory"""
-        if not os.path.exists(self.plugin_directory):
+        try:
+            dir_mtime = os.stat(self.plugin_directory).st_mtime
+            # No file added, removed or renamed since the last scan
+            if self._dir_snapshot and self._dir_snapshot[0] == dir_mtime:
+                return
+            entries = os.scandir(self.plugin_directory)
+        except FileNotFoundError:
             return
         
-        for filename in os.listdir(self.plugin_directory):
-            if filename.endswith('.py') and not filename.startswith('__'):
-                self.load_plugin(filename[:-3])  # Remove .py extension
+        names = set()
+        loaded = []
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name[-3:] == '.py' and name[:2] != '__' and entry.is_file(follow_symlinks=False):
+                    name = name[:-3]  # Remove .py extension
+                    names.add(name)
+                    previous = self.plugins.get(name)
+                    if self._load_plugin_from_path(name, entry.path, notify=False):
+                        plugin = self.plugins[name]
+                        if plugin is not previous:
+                            loaded.append((name, plugin))
+        
+        # Drop plugins whose files disappeared since the last scan
+        if self._dir_snapshot:
+            for name in self._dir_snapshot[1] - names:
+                self.unload_plugin(name)
+        self._dir_snapshot = (dir_mtime, frozenset(names))
+        
+        # One event for the whole scan instead of one plugin_loaded per file
+        if loaded:
+            self._notify("plugins_loaded", loaded)
+    
+    def invalidate_cache(self):
+        """Forget the last directory scan, so load_plugins rescans (e.g. after editing a plugin file)"""
+        self._dir_snapshot = None
     
     def load_plugin(self, plugin_name: str) -> bool:
         """Load a specific plugin"""
+        plugin_path = os.path.join(self.plugin_directory, f"{plugin_name}.py")
+        if not os.path.exists(plugin_path):
+            return False
+        return self._load_plugin_from_path(plugin_name, plugin_path)
+    
+    def _load_plugin_from_path(self, plugin_name: str, plugin_path: str, notify: bool = True) -> bool:
+        """Load a plugin from a file already known to exist"""
         try:
-            plugin_path = os.path.join(self.plugin_directory, f"{plugin_name}.py")
-            if not os.path.exists(plugin_path):
-                return False
+            plugin_path = os.path.abspath(plugin_path)
+            mtime = os.stat(plugin_path).st_mtime
+            module_name = f"uart_plugin_{plugin_name}"
+            module = sys.modules.get(module_name)
+            fresh = (module is not None
+                     and getattr(module, '__file__', None) == plugin_path
+                     and _module_mtimes.get(module_name) == mtime)
             
-            # Load module dynamically
-            spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
-            if spec is None or spec.loader is None:
-                return False
+            # Already loaded from an unchanged file: nothing to do
+            if fresh and plugin_name in self.plugins:
+                return True
             
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            if not fresh:
+                module = self._exec_plugin_module(module_name, plugin_path, mtime)
+                if module is None:
+                    return False
             
             # Find plugin class (should be named Plugin)
             if hasattr(module, 'Plugin'):
@@ -99,7 +190,12 @@ class PluginManager:
                 
                 if isinstance(plugin_instance, UARTPlugin):
                     self.plugins[plugin_name] = plugin_instance
-                    self._notify("plugin_loaded", plugin_name, plugin_instance)
+                    if plugin_instance.enabled:
+                        self._mark_enabled(plugin_name, plugin_instance)
+                    else:
+                        self._mark_disabled(plugin_name)
+                    if notify:
+                        self._notify("plugin_loaded", plugin_name, plugin_instance)
                     return True
             
             return False
@@ -108,10 +204,27 @@ class PluginManager:
             self._notify("plugin_error", f"Failed to load plugin {plugin_name}: {str(e)}")
             return False
     
+    def _exec_plugin_module(self, module_name: str, plugin_path: str, mtime: float) -> Optional[ModuleType]:
+        """Execute a plugin file and register it in sys.modules"""
+        spec = importlib.util.spec_from_file_location(module_name, plugin_path)
+        if spec is None or spec.loader is None:
+            return None
+        
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            _module_mtimes.pop(module_name, None)
+            raise
+        _module_mtimes[module_name] = mtime
+        return module
+    
     def unload_plugin(self, plugin_name: str):
         """Unload a plugin"""
-        if plugin_name in self.plugins:
-            del self.plugins[plugin_name]
+        if self.plugins.pop(plugin_name, None) is not None:
+            self._mark_disabled(plugin_name)
             self._notify("plugin_unloaded", plugin_name)
     
     def get_plugin(self, plugin_name: str) -> Optional[UARTPlugin]:
@@ -124,114 +237,159 @@ class PluginManager:
     
     def get_enabled_plugins(self) -> Dict[str, UARTPlugin]:
         """Get all enabled plugins"""
-        return {name: plugin for name, plugin in self.plugins.items() if plugin.enabled}
+        return self._enabled_plugins.copy()
     
     def enable_plugin(self, plugin_name: str):
         """Enable a plugin"""
-        if plugin_name in self.plugins:
-            self.plugins[plugin_name].enabled = True
+        plugin = self.plugins.get(plugin_name)
+        if plugin is not None:
+            plugin.enabled = True
+            self._mark_enabled(plugin_name, plugin)
     
     def disable_plugin(self, plugin_name: str):
         """Disable a plugin"""
-        if plugin_name in self.plugins:
-            self.plugins[plugin_name].enabled = False
+        plugin = self.plugins.get(plugin_name)
+        if plugin is not None:
+            plugin.enabled = False
+            self._mark_disabled(plugin_name)
+    
+    def _mark_enabled(self, plugin_name: str, plugin: UARTPlugin):
+        """Add a plugin to the enabled mirror and bind its handlers"""
+        self._enabled_plugins[plugin_name] = plugin
+        self._handlers[plugin_name] = (plugin.validate_parameters,
+                                       plugin.process_command,
+                                       plugin.parse_response)
+    
+    def _mark_disabled(self, plugin_name: str):
+        """Drop a plugin from the enabled mirror"""
+        self._enabled_plugins.pop(plugin_name, None)
+        self._handlers.pop(plugin_name, None)
     
     def get_commands_for_plugin(self, plugin_name: str) -> Dict[str, Any]:
         """Get commands for a specific plugin"""
-        plugin = self.get_plugin(plugin_name)
-        if plugin and plugin.enabled:
+        plugin = self._enabled_plugins.get(plugin_name)
+        if plugin:
             return plugin.get_commands()
         return {}
     
     def execute_plugin_command(self, plugin_name: str, command: str, parameters: Dict[str, Any]) -> Optional[bytes]:
         """Execute a command using a specific plugin"""
-        plugin = self.get_plugin(plugin_name)
-        if plugin and plugin.enabled:
+        handlers = self._handlers.get(plugin_name)
+        if handlers:
+            validate, process, _ = handlers
             try:
-                if plugin.validate_parameters(command, parameters):
-                    return plugin.process_command(command, parameters)
+                if validate(command, parameters):
+                    return process(command, parameters)
             except Exception as e:
                 self._notify("plugin_error", f"Error executing {plugin_name}.{command}: {str(e)}")
         return None
     
     def parse_response_with_plugin(self, plugin_name: str, data: bytes) -> Optional[Dict[str, Any]]:
         """Parse response using a specific plugin"""
-        plugin = self.get_plugin(plugin_name)
-        if plugin and plugin.enabled:
+        handlers = self._handlers.get(plugin_name)
+        if handlers:
             try:
-                return plugin.parse_response(data)
+                return handlers[2](data)
             except Exception as e:
                 self._notify("plugin_error", f"Error parsing response with {plugin_name}: {str(e)}")
         return None
 
 
+def xor_checksum(data: BytesLike) -> int:
+    """Calculate XOR checksum"""
+    if isinstance(data, memoryview):
+        # Iterate and measure in bytes; cast() only takes contiguous views
+        data = data.cast('B') if data.c_contiguous else bytes(data)
+    if len(data) < 96:
+        # Short frames: the word path's memoryview setup costs more than
+        # a byte-wise reduce until roughly 96 bytes
+        return reduce(operator.xor, data, 0)
+    
+    if len(data) >= 1024:
+        # Treat the whole buffer as one big integer and halve it until a
+        # single byte is left; every step is one C-level shift and XOR
+        acc = int.from_bytes(data, 'little')
+        width = 1 << (len(data) - 1).bit_length()  # in bytes
+        while width > 1:
+            width >>= 1
+            acc = (acc >> (width * 8)) ^ (acc & ((1 << (width * 8)) - 1))
+        return acc
+    
+    # XOR the buffer as native 64-bit words, then fold the word to a byte
+    view = memoryview(data)
+    end = len(data) & ~7
+    acc = reduce(operator.xor, view[:end].cast('Q'), 0)
+    acc ^= acc >> 32
+    acc ^= acc >> 16
+    acc ^= acc >> 8
+    return reduce(operator.xor, view[end:], acc & 0xFF)
+
+
+def crc8_checksum(data: BytesLike, poly: int = 0x07) -> int:
+    """Calculate CRC-8 checksum"""
+    if isinstance(data, memoryview):
+        data = data.cast('B') if data.c_contiguous else bytes(data)
+    table = _crc8_table(poly)
+    crc = 0
+    for byte in data:
+        crc = table[crc ^ byte]
+    return crc
+
+
+def fixed_checksum(value: int = 0x6B) -> int:
+    """Return fixed checksum value"""
+    return value
+
+
 class ChecksumCalculator:
-    """Utility class for calculating different types of checksums"""
-    
-    @staticmethod
-    def xor_checksum(data: bytes) -> int:
-        """Calculate XOR checksum"""
-        result = 0
-        for byte in data:
-            result ^= byte
-        return result
-    
-    @staticmethod
-    def crc8_checksum(data: bytes, poly: int = 0x07) -> int:
-        """Calculate CRC-8 checksum"""
-        crc = 0
-        for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x80:
-                    crc = (crc << 1) ^ poly
-                else:
-                    crc <<= 1
-                crc &= 0xFF
-        return crc
-    
-    @staticmethod
-    def fixed_checksum(value: int = 0x6B) -> int:
-        """Return fixed checksum value"""
-        return value
+    """Utility class for calculating different types of checksums
+    
+    Kept as a namespace for existing callers; the module-level functions
+    are the same objects without the staticmethod lookup.
+    """
+    
+    xor_checksum = staticmethod(xor_checksum)
+    crc8_checksum = staticmethod(crc8_checksum)
+    fixed_checksum = staticmethod(fixed_checksum)
 
 
-def create_plugin_template(plugin_name: str, output_path: str):
-    """Create a template plugin file"""
-    template = f'''#!/usr/bin/env python3
+# Source of plugin files written by create_plugin_template
+_PLUGIN_TEMPLATE = string.Template('''#!/usr/bin/env python3
 """
-{plugin_name} Plugin for UART Command Sender
+${plugin_name} Plugin for UART Command Sender
 Auto-generated plugin template
 """
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT_DIR not in sys.path:
+    sys.path.append(_PARENT_DIR)
 
-from plugin_system import UARTPlugin, ChecksumCalculator
+from plugin_system import UARTPlugin, xor_checksum
 from typing import Dict, Any
 
 
 class Plugin(UARTPlugin):
-    """Plugin for {plugin_name}"""
+    """Plugin for ${plugin_name}"""
     
     def __init__(self):
         super().__init__(
-            name="{plugin_name}",
-            description="Custom plugin for {plugin_name} device communication"
+            name="${plugin_name}",
+            description="Custom plugin for ${plugin_name} device communication"
         )
     
     def get_commands(self) -> Dict[str, Any]:
         """Return available commands for this plugin"""
-        return {{
-            "example_command": {{
+        return {
+            "example_command": {
                 "description": "Example command",
-                "parameters": {{
-                    "param1": {{"type": "int", "min": 0, "max": 255, "default": 1}},
-                    "param2": {{"type": "str", "default": "test"}}
-                }}
-            }}
-        }}
+                "parameters": {
+                    "param1": {"type": "int", "min": 0, "max": 255, "default": 1},
+                    "param2": {"type": "str", "default": "test"}
+                }
+            }
+        }
     
     def process_command(self, command: str, parameters: Dict[str, Any]) -> bytes:
         """Process command and return bytes to send"""
@@ -242,22 +400,22 @@ class Plugin(UARTPlugin):
             
             # Build command: [addr] [data] [checksum]
             cmd_bytes = bytes([addr]) + data
-            checksum = ChecksumCalculator.xor_checksum(cmd_bytes)
+            checksum = xor_checksum(cmd_bytes)
             
             return cmd_bytes + bytes([checksum])
         
-        raise ValueError(f"Unknown command: {{command}}")
+        raise ValueError(f"Unknown command: {command}")
     
     def parse_response(self, data: bytes) -> Dict[str, Any]:
         """Parse received data"""
         if len(data) < 3:
-            return {{"error": "Response too short"}}
+            return {"error": "Response too short"}
         
-        return {{
+        return {
             "raw_data": data.hex(),
             "length": len(data),
             "parsed": True
-        }}
+        }
     
     def validate_parameters(self, command: str, parameters: Dict[str, Any]) -> bool:
         """Validate command parameters"""
@@ -267,7 +425,10 @@ class Plugin(UARTPlugin):
                 return False
         
         return True
-'''
-    
+''')
+
+
+def create_plugin_template(plugin_name: str, output_path: str):
+    """Create a template plugin file"""
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(template)
+        f.write(_PLUGIN_TEMPLATE.substitute(plugin_name=plugin_name))
@@ -7,29 +7,335 @@ Supports 485/CAN bus communication with various checksum methods
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import struct
+from types import MappingProxyType
+from functools import lru_cache
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PARENT_DIR not in sys.path:
+    sys.path.append(_PARENT_DIR)
 
 from plugin_system import UARTPlugin, ChecksumCalculator
-from typing import Dict, Any, Union
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple, Union
+
+
+# Full reply length (address through checksum) for read commands whose
+# reply has a fixed size; every other command answers with a 4-byte status
+_READ_REPLY_LENGTHS = {
+    0x1F: 5,   # firmware / hardware version
+    0x20: 7,   # phase resistance / inductance
+    0x21: 15,  # Kp / Ki / Kd
+    0x24: 5,   # bus voltage
+    0x27: 5,   # phase current
+    0x31: 5,   # encoder value
+    0x32: 8,   # input pulses
+    0x33: 8,   # target position
+    0x34: 8,   # realtime target
+    0x35: 6,   # realtime speed
+    0x36: 8,   # realtime position
+    0x37: 8,   # position error
+    0x3A: 4,   # motor status
+    0x3B: 4,   # homing status
+}
+_STATUS_REPLY_LENGTH = 4
+
+# Status bytes of the short reply a drive sends when it rejects a command
+_ERROR_STATUS = frozenset({0xE2, 0xEE})
+
+# Degrees per position count (65536 counts per turn); exact in binary, so
+# multiplying gives the same result as the old (pos * 360) / 65536
+_DEG_PER_LSB = 360 / 65536
+
+# Fixed sub code sent after the function code by read commands that have one
+_READ_SUB_CODES = {
+    "read_drive_config": 0x6C,
+    "read_system_status": 0x7A,
+}
+
+# Precompiled frame layouts (little-endian, checksum appended separately)
+_FRAME_2B = struct.Struct('<2B')
+_FRAME_3B = struct.Struct('<3B')
+_FRAME_4B = struct.Struct('<4B')
+_FRAME_5B = struct.Struct('<5B')
+_SPEED_MODE_FRAME = struct.Struct('<3BH2B')
+_POSITION_MODE_FRAME = struct.Struct('<3BHBI2B')
+_OPEN_LOOP_CURRENT_FRAME = struct.Struct('<4BH')
+_HOMING_PARAMS_FRAME = struct.Struct('<6BHI3HB')
+_STORE_SPEED_FRAME = struct.Struct('<5BH2B')
+
+# Choice -> field value lookups shared by every builder; values outside a
+# map fall back to the builder's default field value
+_HOMING_MODE = {"Nearest": 0, "Direction": 1, "Multi-collision": 2, "Multi-limit": 3}
+_DIR = {"CW": 0, "CCW": 1}
+_ENABLE = {"Disable": 0, "Enable": 1}
+_YESNO = {"No": 0, "Yes": 1}
+_LOOP = {"Closed Loop": 2, "Open Loop": 1}
+_POSITION = {"Relative": 0, "Absolute": 1}
+_OPERATION = {"Clear": 0, "Store": 1}
+
+# Checksum types supported, shared read-only by every instance
+_CHECKSUM_TYPES = MappingProxyType({
+    "fixed_0x6B": 0x6B,
+    "xor": "xor",
+    "crc8": "crc8"
+})
+
+# Parameter keys a send may use and still hit the flat (command, address,
+# checksum_type) frame cache
+_ADDRESS_ONLY_KEYS = frozenset(("address", "checksum_type"))
+
+# Choices offered by every command's checksum_type parameter
+_CHECKSUM_CHOICES = tuple(_CHECKSUM_TYPES)
+
+# checksum_type parameter definition, shared by every command entry
+_CHECKSUM_PARAM = {"type": "choice", "choices": _CHECKSUM_CHOICES, "default": "fixed_0x6B"}
+
+
+def _fmt_encoder(payload: memoryview) -> str:
+    """0x31 calibrated encoder value"""
+    value = int.from_bytes(payload, 'big')
+    return f"[Encoder] Calibrated encoder value: {value} (0-65535, 1 turn)"
+
+
+def _fmt_input_pulses(payload: memoryview) -> str:
+    """0x32 input pulse count"""
+    sign = '-' if payload[0] == 1 else '+'
+    pulses = int.from_bytes(payload[1:], 'big', signed=False)
+    return f"[Input Pulses] {sign}{pulses} pulses"
+
+
+def _fmt_target_position(payload: memoryview) -> str:
+    """0x33 target position"""
+    sign = '-' if payload[0] == 1 else '+'
+    pos = int.from_bytes(payload[1:], 'big', signed=False)
+    deg = pos * _DEG_PER_LSB
+    return f"[Target Position] {sign}{pos} ({deg:.2f}°)"
+
+
+def _fmt_realtime_target(payload: memoryview) -> str:
+    """0x34 realtime target position"""
+    sign = '-' if payload[0] == 1 else '+'
+    pos = int.from_bytes(payload[1:], 'big', signed=False)
+    deg = pos * _DEG_PER_LSB
+    return f"[Realtime Target] {sign}{pos} ({deg:.2f}°)"
+
+
+def _fmt_realtime_speed(payload: memoryview) -> str:
+    """0x35 realtime speed"""
+    sign = '-' if payload[0] == 1 else '+'
+    speed = int.from_bytes(payload[1:], 'big', signed=False)
+    return f"[Realtime Speed] {sign}{speed} RPM"
+
+
+def _fmt_realtime_position(payload: memoryview) -> str:
+    """0x36 realtime position"""
+    sign = '-' if payload[0] == 1 else '+'
+    pos = int.from_bytes(payload[1:], 'big', signed=False)
+    deg = pos * _DEG_PER_LSB
+    return f"[Realtime Position] {sign}{pos} ({deg:.2f}°)"
+
+
+def _fmt_position_error(payload: memoryview) -> str:
+    """0x37 position error"""
+    sign = '-' if payload[0] == 1 else '+'
+    err = int.from_bytes(payload[1:], 'big', signed=False)
+    deg = err * _DEG_PER_LSB
+    return f"[Position Error] {sign}{err} ({deg:.5f}°)"
+
+
+def _fmt_motor_status(payload: memoryview) -> str:
+    """0x3A motor status flags"""
+    status = payload[0]
+    bits = [
+        (status & 0x01, "Enabled"),
+        (status & 0x02, "In Position"),
+        (status & 0x04, "Stall"),
+        (status & 0x08, "Stall Protection")
+    ]
+    flags = ', '.join([desc for bit, desc in bits if bit])
+    return f"[Motor Status] Flags: {flags or 'None'} (0x{status:02X})"
+
+
+def _fmt_homing_status(payload: memoryview) -> str:
+    """0x3B homing status flags"""
+    status = payload[0]
+    bits = [
+        (status & 0x01, "Encoder Ready"),
+        (status & 0x02, "Table Ready"),
+        (status & 0x04, "Homing"),
+        (status & 0x08, "Homing Failed")
+    ]
+    flags = ', '.join([desc for bit, desc in bits if bit])
+    return f"[Homing Status] Flags: {flags or 'None'} (0x{status:02X})"
+
+
+def _fmt_version(payload: memoryview) -> str:
+    """0x1F firmware / hardware version"""
+    fw, hw = payload
+    return f"[Version] Firmware: 0x{fw:02X}, Hardware: 0x{hw:02X}"
+
+
+def _fmt_motor_params(payload: memoryview) -> str:
+    """0x20 phase resistance / inductance"""
+    res = int.from_bytes(payload[:2], 'big')
+    ind = int.from_bytes(payload[2:], 'big')
+    return f"[Motor Params] Resistance: {res} mΩ, Inductance: {ind} uH"
+
+
+def _fmt_pid(payload: memoryview) -> str:
+    """0x21 PID parameters"""
+    kp = int.from_bytes(payload[0:4], 'big')
+    ki = int.from_bytes(payload[4:8], 'big')
+    kd = int.from_bytes(payload[8:12], 'big')
+    return f"[PID] Kp: {kp}, Ki: {ki}, Kd: {kd}"
+
+
+def _fmt_bus_voltage(payload: memoryview) -> str:
+    """0x24 bus voltage"""
+    voltage = int.from_bytes(payload, 'big')
+    return f"[Bus Voltage] {voltage} mV"
+
+
+def _fmt_phase_current(payload: memoryview) -> str:
+    """0x27 phase current"""
+    current = int.from_bytes(payload, 'big')
+    return f"[Phase Current] {current} mA"
+
+
+# Human-readable formatter per (function code, payload length) of a reply
+_FORMATTERS = {
+    (0x31, 2): _fmt_encoder,
+    (0x32, 5): _fmt_input_pulses,
+    (0x33, 5): _fmt_target_position,
+    (0x34, 5): _fmt_realtime_target,
+    (0x35, 3): _fmt_realtime_speed,
+    (0x36, 5): _fmt_realtime_position,
+    (0x37, 5): _fmt_position_error,
+    (0x3A, 1): _fmt_motor_status,
+    (0x3B, 1): _fmt_homing_status,
+    (0x1F, 2): _fmt_version,
+    (0x20, 4): _fmt_motor_params,
+    (0x21, 12): _fmt_pid,
+    (0x24, 2): _fmt_bus_voltage,
+    (0x27, 2): _fmt_phase_current,
+}
+
+# Replies of any length that are only shown as raw bytes, with their label
+_RAW_FORMAT_LABELS = {
+    0x42: "Driver Config",
+    0x43: "System Status",
+}
+
+
+def _int_validator(low: float, high: float) -> Callable[[Any], bool]:
+    """Checker for an "int" parameter bounded by low and high"""
+    def check(value: Any) -> bool:
+        return isinstance(value, int) and low <= value <= high
+    return check
+
+
+def _choice_validator(choices: Iterable[Any]) -> Callable[[Any], bool]:
+    """Checker for a "choice" parameter"""
+    allowed = frozenset(choices)
+    def check(value: Any) -> bool:
+        try:
+            return value in allowed
+        except TypeError:  # unhashable values are never a valid choice
+            return False
+    return check
+
+
+def _compile_validators(cmd_params: Dict[str, Any]) -> List[Tuple[str, Callable[[Any], bool]]]:
+    """Turn a command's parameter definitions into (name, checker) pairs"""
+    validators = []
+    for param_name, param_config in cmd_params.items():
+        param_type = param_config.get("type", "str")
+        if param_type == "int":
+            check = _int_validator(param_config.get("min", float("-inf")),
+                                   param_config.get("max", float("inf")))
+        elif param_type == "choice":
+            check = _choice_validator(param_config.get("choices", []))
+        else:
+            continue  # other types accept any value
+        validators.append((param_name, check))
+    return validators
 
 
 class Plugin(UARTPlugin):
     """Plugin for Emm42 V5.0 stepper motor driver"""
     
+    __slots__ = ('_commands', '_builders', '_reply_lengths', '_validators', '_build_cached', '_build_static')
+    
+    checksum_types = _CHECKSUM_TYPES
+    status_reply_length = _STATUS_REPLY_LENGTH
+    
     def __init__(self):
         super().__init__(
             name="Emm42_V5.0",
             description="Emm42 V5.0 closed-loop stepper motor driver communication plugin"
         )
         
-        # Checksum types supported
-        self.checksum_types = {
-            "fixed_0x6B": 0x6B,
-            "xor": "xor",
-            "crc8": "crc8"        }
+        # Command table, built once, shared by every lookup and read-only to callers
+        self._commands = MappingProxyType(self._build_commands())
+        
+        # Frame builder per command, each returning the frame without its checksum
+        self._builders = {
+            "custom_command": self._build_custom_command,
+            "motor_enable": self._build_motor_enable,
+            "speed_mode": self._build_speed_mode,
+            "position_mode": self._build_position_mode,
+            "immediate_stop": self._build_immediate_stop,
+            "sync_motion": self._build_sync_motion,
+            "set_zero_position": self._build_set_zero_position,
+            "trigger_homing": self._build_trigger_homing,
+            "stop_homing": self._build_stop_homing,
+            "calibrate_encoder": self._build_calibrate_encoder,
+            "clear_position": self._build_clear_position,
+            "clear_stall_protection": self._build_clear_stall_protection,
+            "factory_reset": self._build_factory_reset,
+            "modify_subdivision": self._build_modify_subdivision,
+            "modify_id_address": self._build_modify_id_address,
+            "switch_open_closed_loop": self._build_switch_open_closed_loop,
+            "modify_open_loop_current": self._build_modify_open_loop_current,
+            "modify_homing_params": self._build_modify_homing_params,
+            "store_speed_params": self._build_store_speed_params,
+            "modify_speed_scale": self._build_modify_speed_scale
+        }
+        for name, info in self._commands.items():
+            if name.startswith("read_"):
+                self._builders[name] = self._make_read_builder(info["func_code"], _READ_SUB_CODES.get(name))
+        
+        # Reply length per command; None where it is variable or unknown
+        self._reply_lengths = {}
+        for name, info in self._commands.items():
+            func_code = info.get("func_code")
+            if func_code is None:
+                self._reply_lengths[name] = None
+            elif name.startswith("read_"):
+                self._reply_lengths[name] = _READ_REPLY_LENGTHS.get(func_code)
+            else:
+                self._reply_lengths[name] = _STATUS_REPLY_LENGTH
+        
+        # Parameter checkers per command, compiled from the command table
+        self._validators = {name: _compile_validators(info.get("parameters", {}))
+                            for name, info in self._commands.items()}
+        
+        # Finished frames for repeated identical sends, per instance so the
+        # cache never outlives the plugin
+        self._build_cached = lru_cache(maxsize=256)(self._build_from_items)
+        self._build_static = lru_cache(maxsize=1024)(self._build_from_address)
+        
+        # Prewarm the cache with every command's default frame
+        for name, info in self._commands.items():
+            if name != "custom_command":
+                defaults = {key: config["default"] for key, config in info["parameters"].items()}
+                self.process_command(name, defaults)
     
     def get_commands(self) -> Dict[str, Any]:
         """Return available commands for Emm42 V5.0 based on official specification"""
+        return self._commands
+    
+    def _build_commands(self) -> Dict[str, Any]:
+        """Build the command table returned by get_commands"""
         return {
             # 6.3.1 Control Action Commands
             "motor_enable": {
@@ -39,7 +345,7 @@ class Plugin(UARTPlugin):
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
                     "enable": {"type": "choice", "choices": ["Disable", "Enable"], "default": "Enable"},
                     "sync": {"type": "choice", "choices": ["No", "Yes"], "default": "No"},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "speed_mode": {
@@ -51,7 +357,7 @@ class Plugin(UARTPlugin):
                     "speed": {"type": "int", "min": 0, "max": 65535, "default": 100, "description": "Speed in RPM"},
                     "acceleration": {"type": "int", "min": 0, "max": 255, "default": 10, "description": "Acceleration level (0=no curve)"},
                     "sync": {"type": "choice", "choices": ["No", "Yes"], "default": "No"},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "position_mode": {
@@ -65,7 +371,7 @@ class Plugin(UARTPlugin):
                     "pulses": {"type": "int", "min": 0, "max": 4294967295, "default": 3200, "description": "Number of pulses"},
                     "mode": {"type": "choice", "choices": ["Relative", "Absolute"], "default": "Relative"},
                     "sync": {"type": "choice", "choices": ["No", "Yes"], "default": "No"},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "immediate_stop": {
@@ -74,7 +380,7 @@ class Plugin(UARTPlugin):
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
                     "sync": {"type": "choice", "choices": ["No", "Yes"], "default": "No"},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "sync_motion": {
@@ -82,7 +388,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0xFF,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             
@@ -93,7 +399,7 @@ class Plugin(UARTPlugin):
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
                     "save": {"type": "choice", "choices": ["No", "Yes"], "default": "Yes"},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "trigger_homing": {
@@ -103,7 +409,7 @@ class Plugin(UARTPlugin):
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
                     "mode": {"type": "choice", "choices": ["Nearest", "Direction", "Multi-collision", "Multi-limit"], "default": "Nearest"},
                     "sync": {"type": "choice", "choices": ["No", "Yes"], "default": "No"},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "stop_homing": {
@@ -111,7 +417,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x9C,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             
@@ -121,7 +427,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x06,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "clear_position": {
@@ -129,7 +435,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x0A,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "clear_stall_protection": {
@@ -137,7 +443,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x0E,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "factory_reset": {
@@ -145,7 +451,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x0F,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             
@@ -155,7 +461,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x1F,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_motor_params": {
@@ -163,7 +469,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x20,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_pid_params": {
@@ -171,7 +477,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x21,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_homing_params": {
@@ -179,7 +485,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x22,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_bus_voltage": {
@@ -187,7 +493,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x24,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_phase_current": {
@@ -195,7 +501,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x27,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_encoder_value": {
@@ -203,7 +509,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x31,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_input_pulses": {
@@ -211,7 +517,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x32,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_target_position": {
@@ -219,7 +525,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x33,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_realtime_target": {
@@ -227,7 +533,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x34,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_realtime_speed": {
@@ -235,7 +541,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x35,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_realtime_position": {
@@ -243,7 +549,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x36,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_position_error": {
@@ -251,7 +557,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x37,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_motor_status": {
@@ -259,7 +565,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x3A,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_homing_status": {
@@ -267,7 +573,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x3B,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_drive_config": {
@@ -275,7 +581,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x42,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "read_system_status": {
@@ -283,7 +589,7 @@ class Plugin(UARTPlugin):
                 "func_code": 0x43,
                 "parameters": {
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             
@@ -295,7 +601,7 @@ class Plugin(UARTPlugin):
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
                     "save": {"type": "choice", "choices": ["No", "Yes"], "default": "Yes"},
                     "subdivision": {"type": "int", "min": 1, "max": 256, "default": 16, "description": "Subdivision (0=256)"},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "modify_id_address": {
@@ -305,7 +611,7 @@ class Plugin(UARTPlugin):
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
                     "save": {"type": "choice", "choices": ["No", "Yes"], "default": "Yes"},
                     "new_id": {"type": "int", "min": 1, "max": 255, "default": 2},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "switch_open_closed_loop": {
@@ -315,7 +621,7 @@ class Plugin(UARTPlugin):
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
                     "save": {"type": "choice", "choices": ["No", "Yes"], "default": "Yes"},
                     "mode": {"type": "choice", "choices": ["Open Loop", "Closed Loop"], "default": "Closed Loop"},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },            "modify_open_loop_current": {
                 "description": "Modify open loop current (0x44)",
@@ -324,7 +630,7 @@ class Plugin(UARTPlugin):
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
                     "save": {"type": "choice", "choices": ["No", "Yes"], "default": "No"},
                     "current": {"type": "int", "min": 0, "max": 65535, "default": 1000, "description": "Current in mA"},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "modify_homing_params": {
@@ -341,7 +647,7 @@ class Plugin(UARTPlugin):
                     "collision_current": {"type": "int", "min": 0, "max": 65535, "default": 800, "description": "Current for collision detection"},
                     "collision_time": {"type": "int", "min": 0, "max": 65535, "default": 60, "description": "Collision detection time"},
                     "auto_homing": {"type": "choice", "choices": ["Disable", "Enable"], "default": "Disable"},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "store_speed_params": {
@@ -354,7 +660,7 @@ class Plugin(UARTPlugin):
                     "speed": {"type": "int", "min": 0, "max": 65535, "default": 100, "description": "Speed in RPM"},
                     "acceleration": {"type": "int", "min": 0, "max": 255, "default": 10, "description": "Acceleration level"},
                     "en_control": {"type": "choice", "choices": ["Disable", "Enable"], "default": "Disable"},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             "modify_speed_scale": {
@@ -364,7 +670,7 @@ class Plugin(UARTPlugin):
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
                     "save": {"type": "choice", "choices": ["No", "Yes"], "default": "Yes"},
                     "scale_enable": {"type": "choice", "choices": ["Disable", "Enable"], "default": "Disable"},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             },
             
@@ -375,29 +681,11 @@ class Plugin(UARTPlugin):
                     "address": {"type": "int", "min": 0, "max": 255, "default": 1},
                     "func_code": {"type": "int", "min": 0, "max": 255, "default": 0x06, "description": "Function code in hex"},
                     "data": {"type": "str", "default": "", "description": "Hex data (e.g., '00 01 02')"},
-                    "checksum_type": {"type": "choice", "choices": list(self.checksum_types.keys()), "default": "fixed_0x6B"}
+                    "checksum_type": _CHECKSUM_PARAM
                 }
             }
         }
     
-    def _int32_to_bytes(self, value: int) -> list:
-        """Convert 32-bit signed integer to bytes (little-endian)"""
-        if value < 0:
-            value = (1 << 32) + value  # Convert to unsigned
-        return [
-            value & 0xFF,
-            (value >> 8) & 0xFF,
-            (value >> 16) & 0xFF,
-            (value >> 24) & 0xFF
-        ]
-    
-    def _int16_to_bytes(self, value: int) -> list:
-        """Convert 16-bit integer to bytes (little-endian)"""
-        return [
-            value & 0xFF,
-            (value >> 8) & 0xFF
-        ]
-    
     def _calculate_checksum(self, data: bytes, checksum_type: str) -> int:
         """Calculate checksum based on type"""
         if checksum_type == "fixed_0x6B":
@@ -411,184 +699,235 @@ class Plugin(UARTPlugin):
     
     def process_command(self, command: str, parameters: Dict[str, Any]) -> bytes:
         """Process command and return bytes to send according to official specification"""
-        commands = self.get_commands()
-        if command not in commands:
+        # custom_command payloads can be arbitrarily long, so never cache them
+        if command != "custom_command":
+            # Address-only sends (every read_* poll) use a cheaper flat key
+            if parameters.keys() <= _ADDRESS_ONLY_KEYS:
+                address = parameters.get("address", 1)
+                checksum_type = parameters.get("checksum_type", "fixed_0x6B")
+                if type(address) is int and type(checksum_type) is str:
+                    return self._build_static(command, address, checksum_type)
+            
+            # The value's type is part of the key so 1, 1.0 and True do not
+            # share an entry; unhashable values simply skip the cache
+            items = tuple(sorted((k, type(v), v) for k, v in parameters.items()))
+            try:
+                hash(items)
+            except TypeError:
+                pass
+            else:
+                return self._build_cached(command, items)
+        return self._build_frame(command, parameters)
+    
+    def _build_from_address(self, command: str, address: int, checksum_type: str) -> bytes:
+        """Build a frame for a send that only sets address and checksum_type"""
+        return self._build_frame(command, {"address": address, "checksum_type": checksum_type})
+    
+    def _build_from_items(self, command: str, items: Tuple[Tuple[str, type, Any], ...]) -> bytes:
+        """Build a frame from the cache key produced by process_command"""
+        return self._build_frame(command, {k: v for k, _, v in items})
+    
+    def _build_frame(self, command: str, parameters: Dict[str, Any]) -> bytes:
+        """Build the complete frame, checksum included"""
+        cmd_info = self._commands.get(command)
+        if cmd_info is None:
             raise ValueError(f"Unknown command: {command}")
         
-        cmd_info = commands[command]
         address = parameters.get("address", 1)
         checksum_type = parameters.get("checksum_type", "fixed_0x6B")
         
         # Build command based on official specification
-        if command == "custom_command":
-            func_code = parameters.get("func_code", 0x06)
-            data_str = parameters.get("data", "")
-            
-            # Parse hex data string
-            data_bytes = []
-            if data_str:
-                hex_parts = data_str.replace(",", " ").split()
+        try:
+            builder = self._builders.get(command)
+            if builder is None:
+                raise ValueError(f"Command processing not implemented for: {command}")
+            cmd_bytes = builder(address, parameters)
+        except struct.error as e:
+            # Raise what bytes() raised for the same bad field
+            if "not an integer" in str(e):
+                raise TypeError(str(e)) from e
+            raise ValueError(str(e)) from e
+        
+        # Add checksum
+        checksum = self._calculate_checksum(cmd_bytes, checksum_type)
+        cmd_bytes += bytes((checksum,))
+        
+        return cmd_bytes
+
+    def process_commands_batch(self, jobs: List[Tuple[str, Dict[str, Any]]]) -> List[bytes]:
+        """Build frames for a sequence of (command, parameters) jobs, in order"""
+        process = self.process_command
+        return [process(command, parameters) for command, parameters in jobs]
+    
+    def build_broadcast(self, command: str, addresses: Iterable[int], parameters: Dict[str, Any]) -> List[bytes]:
+        """Build the same command for each motor address, e.g. before a sync_motion"""
+        params = dict(parameters)
+        frames = []
+        for address in addresses:
+            params["address"] = address
+            frames.append(self.process_command(command, params))
+        return frames
+
+    def _build_custom_command(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + Function_Code + manual hex data"""
+        func_code = parameters.get("func_code", 0x06)
+        data_str = parameters.get("data", "")
+        
+        # Parse hex data string; two-digit byte tokens decode in one
+        # fromhex call, anything else ("1", "0x1F") is parsed per token
+        data = b""
+        if data_str:
+            cleaned = data_str.replace(",", " ")
+            hex_parts = cleaned.split()
+            try:
+                data = bytes.fromhex(cleaned)
+            except ValueError:
+                data = None
+            if data is None or len(data) != len(hex_parts):
+                data_bytes = []
                 for part in hex_parts:
                     try:
                         data_bytes.append(int(part, 16))
                     except ValueError:
                         raise ValueError(f"Invalid hex data: {part}")
-            
-            cmd_bytes = bytes([address, func_code] + data_bytes)
-        
-        elif command == "motor_enable":
-            # Format: Address + 0xF3 + 0xAB + Enable_State + Sync_Flag + Checksum
-            enable = 1 if parameters.get("enable", "Enable") == "Enable" else 0
-            sync = 1 if parameters.get("sync", "No") == "Yes" else 0
-            cmd_bytes = bytes([address, 0xF3, 0xAB, enable, sync])
-        
-        elif command == "speed_mode":
-            # Format: Address + 0xF6 + Direction + Speed + Acceleration + Sync_Flag + Checksum
-            direction = 1 if parameters.get("direction", "CW") == "CCW" else 0
-            speed = parameters.get("speed", 100)
-            acceleration = parameters.get("acceleration", 10)
-            sync = 1 if parameters.get("sync", "No") == "Yes" else 0
-            speed_bytes = self._int16_to_bytes(speed)
-            cmd_bytes = bytes([address, 0xF6, direction] + speed_bytes + [acceleration, sync])
-        
-        elif command == "position_mode":
-            # Format: Address + 0xFD + Direction + Speed + Acceleration + Pulses + Mode + Sync_Flag + Checksum
-            direction = 1 if parameters.get("direction", "CW") == "CCW" else 0
-            speed = parameters.get("speed", 100)
-            acceleration = parameters.get("acceleration", 10)
-            pulses = parameters.get("pulses", 3200)
-            mode = 1 if parameters.get("mode", "Relative") == "Absolute" else 0
-            sync = 1 if parameters.get("sync", "No") == "Yes" else 0
-            speed_bytes = self._int16_to_bytes(speed)
-            pulse_bytes = self._int32_to_bytes(pulses)
-            cmd_bytes = bytes([address, 0xFD, direction] + speed_bytes + [acceleration] + pulse_bytes + [mode, sync])
-        
-        elif command == "immediate_stop":
-            # Format: Address + 0xFE + 0x98 + Sync_Flag + Checksum
-            sync = 1 if parameters.get("sync", "No") == "Yes" else 0
-            cmd_bytes = bytes([address, 0xFE, 0x98, sync])
-        
-        elif command == "sync_motion":
-            # Format: Address + 0xFF + 0x66 + Checksum
-            cmd_bytes = bytes([address, 0xFF, 0x66])
-        
-        elif command == "set_zero_position":
-            # Format: Address + 0x93 + 0x88 + Save_Flag + Checksum
-            save = 1 if parameters.get("save", "Yes") == "Yes" else 0
-            cmd_bytes = bytes([address, 0x93, 0x88, save])
-        
-        elif command == "trigger_homing":
-            # Format: Address + 0x9A + Homing_Mode + Sync_Flag + Checksum
-            mode_map = {"Nearest": 0, "Direction": 1, "Multi-collision": 2, "Multi-limit": 3}
-            mode = mode_map.get(parameters.get("mode", "Nearest"), 0)
-            sync = 1 if parameters.get("sync", "No") == "Yes" else 0
-            cmd_bytes = bytes([address, 0x9A, mode, sync])
-        
-        elif command == "stop_homing":
-            # Format: Address + 0x9C + 0x48 + Checksum
-            cmd_bytes = bytes([address, 0x9C, 0x48])
-        
-        elif command == "calibrate_encoder":
-            # Format: Address + 0x06 + 0x45 + Checksum
-            cmd_bytes = bytes([address, 0x06, 0x45])
-        
-        elif command == "clear_position":
-            # Format: Address + 0x0A + 0x6D + Checksum
-            cmd_bytes = bytes([address, 0x0A, 0x6D])
-        
-        elif command == "clear_stall_protection":
-            # Format: Address + 0x0E + 0x52 + Checksum
-            cmd_bytes = bytes([address, 0x0E, 0x52])
+                data = data_bytes
         
-        elif command == "factory_reset":
-            # Format: Address + 0x0F + 0x5F + Checksum
-            cmd_bytes = bytes([address, 0x0F, 0x5F])
-        
-        elif command == "modify_subdivision":
-            # Format: Address + 0x84 + 0x8A + Save_Flag + Subdivision + Checksum
-            save = 1 if parameters.get("save", "Yes") == "Yes" else 0
-            subdivision = parameters.get("subdivision", 16)
-            if subdivision == 256:
-                subdivision = 0  # 256 subdivision is represented as 0
-            cmd_bytes = bytes([address, 0x84, 0x8A, save, subdivision])
-        
-        elif command == "modify_id_address":
-            # Format: Address + 0xAE + 0x4B + Save_Flag + New_ID + Checksum
-            save = 1 if parameters.get("save", "Yes") == "Yes" else 0
-            new_id = parameters.get("new_id", 2)
-            cmd_bytes = bytes([address, 0xAE, 0x4B, save, new_id])
-        
-        elif command == "switch_open_closed_loop":
-            # Format: Address + 0x46 + 0x69 + Save_Flag + Mode + Checksum
-            save = 1 if parameters.get("save", "Yes") == "Yes" else 0
-            mode = 1 if parameters.get("mode", "Closed Loop") == "Open Loop" else 2
-            cmd_bytes = bytes([address, 0x46, 0x69, save, mode])
-        
-        elif command == "modify_open_loop_current":
-            # Format: Address + 0x44 + 0x33 + Save_Flag + Current + Checksum
-            save = 1 if parameters.get("save", "No") == "Yes" else 0
-            current = parameters.get("current", 1000)
-            current_bytes = self._int16_to_bytes(current)
-            cmd_bytes = bytes([address, 0x44, 0x33, save] + current_bytes)
-        
-        elif command == "modify_homing_params":
-            # Format: Address + 0x4C + 0xAE + Save_Flag + Params...
-            save = 1 if parameters.get("save", "Yes") == "Yes" else 0
-            mode_map = {"Nearest": 0, "Direction": 1, "Multi-collision": 2, "Multi-limit": 3}
-            mode = mode_map.get(parameters.get("mode", "Nearest"), 0)
-            direction = 1 if parameters.get("direction", "CW") == "CCW" else 0
-            speed = parameters.get("speed", 30)
-            timeout = parameters.get("timeout", 10000)
-            collision_speed = parameters.get("collision_speed", 300)
-            collision_current = parameters.get("collision_current", 800)
-            collision_time = parameters.get("collision_time", 60)
-            auto_homing = 1 if parameters.get("auto_homing", "Disable") == "Enable" else 0
-            
-            speed_bytes = self._int16_to_bytes(speed)
-            timeout_bytes = self._int32_to_bytes(timeout)
-            collision_speed_bytes = self._int16_to_bytes(collision_speed)
-            collision_current_bytes = self._int16_to_bytes(collision_current)
-            collision_time_bytes = self._int16_to_bytes(collision_time)
-            
-            cmd_bytes = bytes([address, 0x4C, 0xAE, save, mode, direction] + 
-                            speed_bytes + timeout_bytes + collision_speed_bytes + 
-                            collision_current_bytes + collision_time_bytes + [auto_homing])
-        
-        elif command == "store_speed_params":
-            # Format: Address + 0xF7 + 0x1C + Operation + Direction + Speed + Acceleration + En_Control + Checksum
-            operation = 1 if parameters.get("operation", "Store") == "Store" else 0
-            direction = 1 if parameters.get("direction", "CW") == "CCW" else 0
-            speed = parameters.get("speed", 100)
-            acceleration = parameters.get("acceleration", 10)
-            en_control = 1 if parameters.get("en_control", "Disable") == "Enable" else 0
-            
-            speed_bytes = self._int16_to_bytes(speed)
-            cmd_bytes = bytes([address, 0xF7, 0x1C, operation, direction] + speed_bytes + [acceleration, en_control])
-        
-        elif command == "modify_speed_scale":
-            # Format: Address + 0x4F + 0x71 + Save_Flag + Scale_Enable + Checksum
-            save = 1 if parameters.get("save", "Yes") == "Yes" else 0
-            scale_enable = 1 if parameters.get("scale_enable", "Disable") == "Enable" else 0
-            cmd_bytes = bytes([address, 0x4F, 0x71, save, scale_enable])
-        
-        elif command.startswith("read_"):
-            # Simple read commands: Address + Function_Code + Checksum
-            func_code = cmd_info["func_code"]
-            if command == "read_drive_config":
-                cmd_bytes = bytes([address, func_code, 0x6C])
-            elif command == "read_system_status":
-                cmd_bytes = bytes([address, func_code, 0x7A])
-            else:
-                cmd_bytes = bytes([address, func_code])
-        
-        else:
-            raise ValueError(f"Command processing not implemented for: {command}")
+        return _FRAME_2B.pack(address, func_code) + bytes(data)
+    
+    def _build_motor_enable(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0xF3 + 0xAB + Enable_State + Sync_Flag"""
+        enable = _ENABLE.get(parameters.get("enable", "Enable"), 0)
+        sync = _YESNO.get(parameters.get("sync", "No"), 0)
+        return _FRAME_5B.pack(address, 0xF3, 0xAB, enable, sync)
+    
+    def _build_speed_mode(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0xF6 + Direction + Speed + Acceleration + Sync_Flag"""
+        get = parameters.get
+        direction = _DIR.get(get("direction", "CW"), 0)
+        speed = get("speed", 100)
+        acceleration = get("acceleration", 10)
+        sync = _YESNO.get(get("sync", "No"), 0)
+        return _SPEED_MODE_FRAME.pack(address, 0xF6, direction, speed & 0xFFFF, acceleration, sync)
+    
+    def _build_position_mode(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0xFD + Direction + Speed + Acceleration + Pulses + Mode + Sync_Flag"""
+        get = parameters.get
+        direction = _DIR.get(get("direction", "CW"), 0)
+        speed = get("speed", 100)
+        acceleration = get("acceleration", 10)
+        pulses = get("pulses", 3200)
+        mode = _POSITION.get(get("mode", "Relative"), 0)
+        sync = _YESNO.get(get("sync", "No"), 0)
+        # Negative pulses wrap as two's complement
+        return _POSITION_MODE_FRAME.pack(address, 0xFD, direction, speed & 0xFFFF, acceleration,
+                                         pulses & 0xFFFFFFFF, mode, sync)
+    
+    def _build_immediate_stop(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0xFE + 0x98 + Sync_Flag"""
+        sync = _YESNO.get(parameters.get("sync", "No"), 0)
+        return _FRAME_4B.pack(address, 0xFE, 0x98, sync)
+    
+    def _build_sync_motion(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0xFF + 0x66"""
+        return _FRAME_3B.pack(address, 0xFF, 0x66)
+    
+    def _build_set_zero_position(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0x93 + 0x88 + Save_Flag"""
+        save = _YESNO.get(parameters.get("save", "Yes"), 0)
+        return _FRAME_4B.pack(address, 0x93, 0x88, save)
+    
+    def _build_trigger_homing(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0x9A + Homing_Mode + Sync_Flag"""
+        mode = _HOMING_MODE.get(parameters.get("mode", "Nearest"), 0)
+        sync = _YESNO.get(parameters.get("sync", "No"), 0)
+        return _FRAME_4B.pack(address, 0x9A, mode, sync)
+    
+    def _build_stop_homing(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0x9C + 0x48"""
+        return _FRAME_3B.pack(address, 0x9C, 0x48)
+    
+    def _build_calibrate_encoder(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0x06 + 0x45"""
+        return _FRAME_3B.pack(address, 0x06, 0x45)
+    
+    def _build_clear_position(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0x0A + 0x6D"""
+        return _FRAME_3B.pack(address, 0x0A, 0x6D)
+    
+    def _build_clear_stall_protection(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0x0E + 0x52"""
+        return _FRAME_3B.pack(address, 0x0E, 0x52)
+    
+    def _build_factory_reset(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0x0F + 0x5F"""
+        return _FRAME_3B.pack(address, 0x0F, 0x5F)
+    
+    def _build_modify_subdivision(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0x84 + 0x8A + Save_Flag + Subdivision"""
+        save = _YESNO.get(parameters.get("save", "Yes"), 0)
+        subdivision = parameters.get("subdivision", 16)
+        if subdivision == 256:
+            subdivision = 0  # 256 subdivision is represented as 0
+        return _FRAME_5B.pack(address, 0x84, 0x8A, save, subdivision)
+    
+    def _build_modify_id_address(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0xAE + 0x4B + Save_Flag + New_ID"""
+        save = _YESNO.get(parameters.get("save", "Yes"), 0)
+        new_id = parameters.get("new_id", 2)
+        return _FRAME_5B.pack(address, 0xAE, 0x4B, save, new_id)
+    
+    def _build_switch_open_closed_loop(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0x46 + 0x69 + Save_Flag + Mode"""
+        save = _YESNO.get(parameters.get("save", "Yes"), 0)
+        mode = _LOOP.get(parameters.get("mode", "Closed Loop"), 2)
+        return _FRAME_5B.pack(address, 0x46, 0x69, save, mode)
+    
+    def _build_modify_open_loop_current(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0x44 + 0x33 + Save_Flag + Current"""
+        save = _YESNO.get(parameters.get("save", "No"), 0)
+        current = parameters.get("current", 1000)
+        return _OPEN_LOOP_CURRENT_FRAME.pack(address, 0x44, 0x33, save, current & 0xFFFF)
+    
+    def _build_modify_homing_params(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0x4C + 0xAE + Save_Flag + Params..."""
+        get = parameters.get
+        save = _YESNO.get(get("save", "Yes"), 0)
+        mode = _HOMING_MODE.get(get("mode", "Nearest"), 0)
+        direction = _DIR.get(get("direction", "CW"), 0)
+        speed = get("speed", 30)
+        timeout = get("timeout", 10000)
+        collision_speed = get("collision_speed", 300)
+        collision_current = get("collision_current", 800)
+        collision_time = get("collision_time", 60)
+        auto_homing = _ENABLE.get(get("auto_homing", "Disable"), 0)
         
-        # Add checksum
-        checksum = self._calculate_checksum(cmd_bytes, checksum_type)
-        cmd_bytes += bytes([checksum])
+        return _HOMING_PARAMS_FRAME.pack(address, 0x4C, 0xAE, save, mode, direction,
+                                         speed & 0xFFFF, timeout & 0xFFFFFFFF, collision_speed & 0xFFFF,
+                                         collision_current & 0xFFFF, collision_time & 0xFFFF, auto_homing)
+    
+    def _build_store_speed_params(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0xF7 + 0x1C + Operation + Direction + Speed + Acceleration + En_Control"""
+        get = parameters.get
+        operation = _OPERATION.get(get("operation", "Store"), 0)
+        direction = _DIR.get(get("direction", "CW"), 0)
+        speed = get("speed", 100)
+        acceleration = get("acceleration", 10)
+        en_control = _ENABLE.get(get("en_control", "Disable"), 0)
         
-        return cmd_bytes
+        return _STORE_SPEED_FRAME.pack(address, 0xF7, 0x1C, operation, direction,
+                                       speed & 0xFFFF, acceleration, en_control)
+    
+    def _build_modify_speed_scale(self, address: int, parameters: Dict[str, Any]) -> bytes:
+        """Address + 0x4F + 0x71 + Save_Flag + Scale_Enable"""
+        save = _YESNO.get(parameters.get("save", "Yes"), 0)
+        scale_enable = _ENABLE.get(parameters.get("scale_enable", "Disable"), 0)
+        return _FRAME_5B.pack(address, 0x4F, 0x71, save, scale_enable)
+    
+    def _make_read_builder(self, func_code: int, sub_code: Optional[int]):
+        """Simple read commands: Address + Function_Code (+ fixed sub code)"""
+        if sub_code is None:
+            return lambda address, parameters: _FRAME_2B.pack(address, func_code)
+        return lambda address, parameters: _FRAME_3B.pack(address, func_code, sub_code)
     
     def parse_response(self, data: bytes) -> Dict[str, Any]:
         """Parse received data from Emm42 V5.0"""
@@ -599,18 +938,25 @@ class Plugin(UARTPlugin):
                 "length": len(data)
             }
         
+        return self._parse_frame(data, *self._split_frame(data))
+    
+    def _split_frame(self, data: bytes) -> Tuple[int, int, memoryview, int]:
+        """Split a response into address, function code, payload and checksum"""
+        # The payload is a view into data, so splitting copies nothing
+        return data[0], data[1], memoryview(data)[2:-1], data[-1]
+    
+    def _parse_frame(self, data: bytes, address: int, func_code: int,
+                     payload: memoryview, checksum: int) -> Dict[str, Any]:
+        """Build the parse_response dict from an already split frame"""
         result = {
-            "raw_data": ' '.join([f'{b:02X}' for b in data]),
+            "raw_data": data.hex(' ').upper(),
             "length": len(data),
-            "address": data[0],
-            "func_code": data[1],
-            "checksum": data[-1]
+            "address": address,
+            "func_code": func_code,
+            "checksum": checksum
         }
         
         # Parse based on function code
-        func_code = data[1]
-        payload = data[2:-1]  # Data between func_code and checksum
-        
         if func_code == 0x31:  # Read position response
             if len(payload) >= 4:
                 position = int.from_bytes(payload[:4], byteorder='little', signed=True)
@@ -650,21 +996,18 @@ class Plugin(UARTPlugin):
         
         # Verify checksum if possible
         if len(data) >= 3:
-            data_without_checksum = data[:-1]
-            
-            # Try different checksum methods
-            checksums = {
-                "fixed_0x6B": 0x6B,
-                "xor": ChecksumCalculator.xor_checksum(data_without_checksum),
-                "crc8": ChecksumCalculator.crc8_checksum(data_without_checksum)
-            }
+            # Checksum the frame in place, without copying it
+            data_without_checksum = memoryview(data)[:-1]
             
-            received_checksum = data[-1]
+            # Try different checksum methods; every match is reported, so
+            # each one still has to be computed
             valid_checksums = []
-            
-            for method, calculated in checksums.items():
-                if calculated == received_checksum:
-                    valid_checksums.append(method)
+            if checksum == 0x6B:
+                valid_checksums.append("fixed_0x6B")
+            if checksum == ChecksumCalculator.xor_checksum(data_without_checksum):
+                valid_checksums.append("xor")
+            if checksum == ChecksumCalculator.crc8_checksum(data_without_checksum):
+                valid_checksums.append("crc8")
             
             result["checksum_valid"] = len(valid_checksums) > 0
             result["possible_checksum_methods"] = valid_checksums
@@ -675,10 +1018,18 @@ class Plugin(UARTPlugin):
         """Convert a raw response to a human-readable string according to the Emm42 V5.0 protocol."""
         if len(data) < 3:
             return f"[Error] Response too short: {data.hex().upper()}"
-        addr = data[0]
-        func = data[1]
-        payload = data[2:-1]
-        checksum = data[-1]
+        return self._format_frame(data, *self._split_frame(data))
+    
+    def parse_and_format(self, data: bytes) -> Tuple[Dict[str, Any], str]:
+        """Return (parse_response(data), response_to_human_readable(data)) splitting the frame once"""
+        if len(data) < 3:
+            return self.parse_response(data), self.response_to_human_readable(data)
+        frame = self._split_frame(data)
+        return self._parse_frame(data, *frame), self._format_frame(data, *frame)
+    
+    def _format_frame(self, data: bytes, addr: int, func: int,
+                      payload: memoryview, checksum: int) -> str:
+        """Build the human-readable description from an already split frame"""
         # Error/acknowledge patterns
         if func == 0x00 and len(data) == 4 and data[2] == 0xEE:
             return f"[Error] Invalid command. Address: {addr}"
@@ -687,105 +1038,41 @@ class Plugin(UARTPlugin):
         if len(data) == 4 and data[2] == 0x02:
             return f"[OK] Command 0x{func:02X} executed successfully. Address: {addr}"
         # Command-specific parsing
-        if func == 0x31 and len(payload) == 2:
-            value = int.from_bytes(payload, 'big')
-            return f"[Encoder] Calibrated encoder value: {value} (0-65535, 1 turn)"
-        if func == 0x32 and len(payload) == 5:
-            sign = '-' if payload[0] == 1 else '+'
-            pulses = int.from_bytes(payload[1:], 'big', signed=False)
-            return f"[Input Pulses] {sign}{pulses} pulses"
-        if func == 0x33 and len(payload) == 5:
-            sign = '-' if payload[0] == 1 else '+'
-            pos = int.from_bytes(payload[1:], 'big', signed=False)
-            deg = (pos * 360) / 65536
-            return f"[Target Position] {sign}{pos} ({deg:.2f}°)"
-        if func == 0x34 and len(payload) == 5:
-            sign = '-' if payload[0] == 1 else '+'
-            pos = int.from_bytes(payload[1:], 'big', signed=False)
-            deg = (pos * 360) / 65536
-            return f"[Realtime Target] {sign}{pos} ({deg:.2f}°)"
-        if func == 0x35 and len(payload) == 3:
-            sign = '-' if payload[0] == 1 else '+'
-            speed = int.from_bytes(payload[1:], 'big', signed=False)
-            return f"[Realtime Speed] {sign}{speed} RPM"
-        if func == 0x36 and len(payload) == 5:
-            sign = '-' if payload[0] == 1 else '+'
-            pos = int.from_bytes(payload[1:], 'big', signed=False)
-            deg = (pos * 360) / 65536
-            return f"[Realtime Position] {sign}{pos} ({deg:.2f}°)"
-        if func == 0x37 and len(payload) == 5:
-            sign = '-' if payload[0] == 1 else '+'
-            err = int.from_bytes(payload[1:], 'big', signed=False)
-            deg = (err * 360) / 65536
-            return f"[Position Error] {sign}{err} ({deg:.5f}°)"
-        if func == 0x3A and len(payload) == 1:
-            status = payload[0]
-            bits = [
-                (status & 0x01, "Enabled"),
-                (status & 0x02, "In Position"),
-                (status & 0x04, "Stall"),
-                (status & 0x08, "Stall Protection")
-            ]
-            flags = ', '.join([desc for bit, desc in bits if bit])
-            return f"[Motor Status] Flags: {flags or 'None'} (0x{status:02X})"
-        if func == 0x3B and len(payload) == 1:
-            status = payload[0]
-            bits = [
-                (status & 0x01, "Encoder Ready"),
-                (status & 0x02, "Table Ready"),
-                (status & 0x04, "Homing"),
-                (status & 0x08, "Homing Failed")
-            ]
-            flags = ', '.join([desc for bit, desc in bits if bit])
-            return f"[Homing Status] Flags: {flags or 'None'} (0x{status:02X})"
-        if func == 0x1F and len(payload) == 2:
-            fw, hw = payload
-            return f"[Version] Firmware: 0x{fw:02X}, Hardware: 0x{hw:02X}"
-        if func == 0x20 and len(payload) == 4:
-            res = int.from_bytes(payload[:2], 'big')
-            ind = int.from_bytes(payload[2:], 'big')
-            return f"[Motor Params] Resistance: {res} mΩ, Inductance: {ind} uH"
-        if func == 0x21 and len(payload) == 12:
-            kp = int.from_bytes(payload[0:4], 'big')
-            ki = int.from_bytes(payload[4:8], 'big')
-            kd = int.from_bytes(payload[8:12], 'big')
-            return f"[PID] Kp: {kp}, Ki: {ki}, Kd: {kd}"
-        if func == 0x24 and len(payload) == 2:
-            voltage = int.from_bytes(payload, 'big')
-            return f"[Bus Voltage] {voltage} mV"
-        if func == 0x27 and len(payload) == 2:
-            current = int.from_bytes(payload, 'big')
-            return f"[Phase Current] {current} mA"
-        if func == 0x42 and len(payload) > 0:
-            return f"[Driver Config] Raw: {' '.join(f'{b:02X}' for b in payload)}"
-        if func == 0x43 and len(payload) > 0:
-            return f"[System Status] Raw: {' '.join(f'{b:02X}' for b in payload)}"
+        formatter = _FORMATTERS.get((func, len(payload)))
+        if formatter is not None:
+            return formatter(payload)
+        if func in _RAW_FORMAT_LABELS and len(payload) > 0:
+            return f"[{_RAW_FORMAT_LABELS[func]}] Raw: {payload.hex(' ').upper()}"
         # Default fallback
-        return f"[Raw] Addr: {addr}, Func: 0x{func:02X}, Payload: {' '.join(f'{b:02X}' for b in payload)}, Checksum: 0x{checksum:02X}"
+        return f"[Raw] Addr: {addr}, Func: 0x{func:02X}, Payload: {payload.hex(' ').upper()}, Checksum: 0x{checksum:02X}"
+    
+    def expected_response_len(self, command: str) -> Optional[int]:
+        """Return the reply length for a command, or None if it varies"""
+        return self._reply_lengths.get(command)
+    
+    def is_status_frame(self, frame: bytes) -> bool:
+        """Return True if a status_reply_length frame can be a complete E2/EE status reply
+        
+        A drive that rejects a read answers with this short frame instead
+        of the data reply. Data replies may start with 0xE2/0xEE as well,
+        so the fourth byte must also check out as the frame's checksum.
+        A data reply can still match by chance; callers tell the two apart
+        by whether more bytes follow.
+        """
+        if len(frame) != _STATUS_REPLY_LENGTH or not (frame[1] == 0x00 or frame[2] in _ERROR_STATUS):
+            return False
+        body, checksum = memoryview(frame)[:-1], frame[-1]
+        return (checksum == 0x6B or checksum == ChecksumCalculator.xor_checksum(body)
+                or checksum == ChecksumCalculator.crc8_checksum(body))
     
     def validate_parameters(self, command: str, parameters: Dict[str, Any]) -> bool:
         """Validate command parameters"""
-        commands = self.get_commands()
-        if command not in commands:
+        validators = self._validators.get(command)
+        if validators is None:
             return False
         
-        cmd_params = commands[command].get("parameters", {})
-        
-        for param_name, param_config in cmd_params.items():
-            if param_name in parameters:
-                value = parameters[param_name]
-                param_type = param_config.get("type", "str")
-                
-                if param_type == "int":
-                    if not isinstance(value, int):
-                        return False
-                    if "min" in param_config and value < param_config["min"]:
-                        return False
-                    if "max" in param_config and value > param_config["max"]:
-                        return False
-                
-                elif param_type == "choice":
-                    if value not in param_config.get("choices", []):
-                        return False
+        for param_name, check in validators:
+            if param_name in parameters and not check(parameters[param_name]):
+                return False
         
         return True
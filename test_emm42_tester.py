@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the Emm42 V5.0 tester's reply framing
+Runs the tester against MockSerial with replies that look like status frames
+"""
+
+import sys
+import os
+import io
+import contextlib
+
+# Add the current directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from emm42_v5_tester import Emm42V5Tester, MockSerial
+
+
+def _mock_tester(templates):
+    """Return a tester on a MockSerial whose read replies are overridden by templates"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        tester = Emm42V5Tester(use_mock=True)
+        assert tester.connect_serial("MOCK")
+    tester.serial_conn._READ_TEMPLATES = {**MockSerial._READ_TEMPLATES, **templates}
+    return tester
+
+
+def _reply(tester, command):
+    """Send command to address 1 and return the reply bytes"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        success, _, response = tester.send_command(command, {"address": 1})
+    assert success
+    return response
+
+
+def test_status_byte_in_payload():
+    """A data reply whose first payload byte is 0xE2/0xEE is read in full"""
+    tester = _mock_tester({
+        0x31: bytes([0xEE, 0x2B, 0x6B]),  # encoder value 0xEE2B
+        0x24: bytes([0xE2, 0x6B, 0x6B]),  # bus voltage 0xE26B: byte 4 looks like a checksum
+    })
+
+    assert _reply(tester, "read_encoder_value") == bytes([0x01, 0x31, 0xEE, 0x2B, 0x6B])
+    assert _reply(tester, "read_bus_voltage") == bytes([0x01, 0x24, 0xE2, 0x6B, 0x6B])
+
+    # Later replies must not be shifted by a byte left behind
+    assert _reply(tester, "read_firmware_version") == bytes([0x01, 0x1F, 0x20, 0x15, 0x6B])
+    assert _reply(tester, "motor_enable") == bytes([0x01, 0xF3, 0x02, 0x6B])
+    print("✓ Payloads starting with E2/EE are read in full")
+
+
+def test_status_reply_to_read():
+    """A read answered by a short EE status frame stops after four bytes"""
+    tester = _mock_tester({0x31: bytes([0xEE, 0x6B])})
+
+    assert _reply(tester, "read_encoder_value") == bytes([0x01, 0x31, 0xEE, 0x6B])
+    assert _reply(tester, "read_firmware_version") == bytes([0x01, 0x1F, 0x20, 0x15, 0x6B])
+    print("✓ Status reply to a read is taken as a status frame")
+
+
+def test_leftover_bytes_discarded():
+    """Bytes left over from an earlier reply do not leak into the next one"""
+    tester = _mock_tester({0x31: bytes([0x1A, 0x2B, 0x6B, 0x99, 0x99])})  # two stray bytes
+
+    assert _reply(tester, "read_encoder_value") == bytes([0x01, 0x31, 0x1A, 0x2B, 0x6B])
+    assert _reply(tester, "read_firmware_version") == bytes([0x01, 0x1F, 0x20, 0x15, 0x6B])
+    print("✓ Stray bytes are dropped before the next command")
+
+
+def main():
+    """Main function"""
+    print("Emm42 V5.0 Tester Framing Tests")
+    print("=" * 40)
+
+    test_status_byte_in_payload()
+    test_status_reply_to_read()
+    test_leftover_bytes_discarded()
+
+    print("\n✓ All framing tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the UART backend's receive framing
+Feeds the reader loop canned reads through a fake serial connection
+"""
+
+import sys
+import os
+
+# Add the current directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from uart_backend import UARTBackend
+
+
+class FakeConnection:
+    """Serial connection stand-in that returns one chunk per arrival"""
+
+    def __init__(self, backend, chunks):
+        self.backend = backend
+        self.chunks = [bytearray(chunk) for chunk in chunks]
+        self.timeout = None
+
+    @property
+    def in_waiting(self):
+        return len(self.chunks[0]) if self.chunks else 0
+
+    def read(self, size=1):
+        if not self.chunks:
+            # Nothing left to arrive: disconnect like disconnect() would
+            self.backend._connected_event.clear()
+            return b''
+        chunk = self.chunks[0]
+        data = bytes(chunk[:size])
+        del chunk[:size]
+        if not chunk:
+            self.chunks.pop(0)
+        return data
+
+
+def _receive(chunks, delimiter=b'\r\n', max_read=None):
+    """Run one read session over chunks and return the delivered messages"""
+    backend = UARTBackend()
+    backend.rx_delimiter = delimiter
+    if max_read is not None:
+        backend.MAX_READ_SIZE = max_read
+    received = []
+    backend.set_data_received_callback(lambda message: received.append(message.data))
+    backend._connected_event.set()
+    backend._read_session(FakeConnection(backend, chunks))
+    return received
+
+
+def test_delimiter_split_across_reads():
+    """A delimiter split between two reads still ends one frame"""
+    received = _receive([b'OK\r', b'\nREADY\r\n', b'A\r\nB\r\n'])
+
+    assert received == [b'OK\r\n', b'READY\r\n', b'A\r\n', b'B\r\n'], received
+    print("✓ Frames are split on a delimiter spanning two reads")
+
+
+def test_overflow_flushes_pending():
+    """Data without a delimiter is handed out once it reaches MAX_READ_SIZE"""
+    received = _receive([b'0123', b'4567', b'89\r\n'], max_read=8)
+
+    assert received == [b'01234567', b'89\r\n'], received
+    print("✓ Unterminated data is flushed at MAX_READ_SIZE")
+
+
+def test_tail_delivered_on_disconnect():
+    """An unterminated tail is delivered when the connection closes"""
+    received = _receive([b'line\r\npartial'])
+
+    assert received == [b'line\r\n', b'partial'], received
+    print("✓ Unterminated tail is delivered on disconnect")
+
+
+def test_no_delimiter_passes_reads_through():
+    """Without a delimiter every read is delivered as it arrives"""
+    received = _receive([b'OK\r', b'\nREADY'], delimiter=None)
+
+    assert received == [b'OK\r', b'\nREADY'], received
+    print("✓ Reads pass through unframed without a delimiter")
+
+
+def main():
+    """Main function"""
+    print("UART Backend Framing Tests")
+    print("=" * 40)
+
+    test_delimiter_split_across_reads()
+    test_overflow_flushes_pending()
+    test_tail_delivered_on_disconnect()
+    test_no_delimiter_passes_reads_through()
+
+    print("\n✓ All framing tests passed!")
+
+
+if __name__ == "__main__":
+    main()
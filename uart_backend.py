@@ -6,15 +6,114 @@ Handles all serial communication logic independently from GUI
 
 import serial
 import serial.tools.list_ports
+import re
 import threading
-import time
 import json
+import os
+import time
+from collections import deque
 from datetime import datetime
-from typing import List, Callable, Optional, Dict, Any
+from typing import List, Callable, Optional, Dict, Any, Iterable, Deque, Set
+
+try:
+    import orjson  # Optional, faster JSON serialisation
+except ImportError:
+    orjson = None
+
+
+# Encoded form of the line ending names offered by the GUI
+LINE_ENDINGS = {
+    "None": b"",
+    "\\r": b"\r",
+    "\\n": b"\n",
+    "\\r\\n": b"\r\n"
+}
+
+# pyserial constants for the parity and stop bit names offered by the GUI
+PARITY_MAP = {
+    "None": serial.PARITY_NONE,
+    "Even": serial.PARITY_EVEN,
+    "Odd": serial.PARITY_ODD,
+    "Mark": serial.PARITY_MARK,
+    "Space": serial.PARITY_SPACE
+}
+
+STOPBITS_MAP = {
+    "1": serial.STOPBITS_ONE,
+    "1.5": serial.STOPBITS_ONE_POINT_FIVE,
+    "2": serial.STOPBITS_TWO
+}
+
+# USB vendor ID of WCH, maker of the CH340/CH341, and the port description
+# patterns its drivers report
+WCH_USB_VID = 0x1A86
+_CH341_DESCRIPTION = re.compile(r"CH34[01]|WCH", re.IGNORECASE)
+
+# Type of each connection setting accepted from a saved config file
+CONFIG_SCHEMA = {
+    'port': str,
+    'baudrate': int,
+    'bytesize': int,
+    'parity': str,
+    'stopbits': str,
+    'timeout': (int, float)
+}
+
+# Whitespace dropped from HEX input before parsing
+_HEX_STRIP = str.maketrans('', '', ' \t')
+
+
+def _write_json(filename: str, data: Any):
+    """Write data as indented JSON, replacing filename atomically"""
+    if orjson:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode('utf-8')
+    write_file_atomic(filename, payload)
+
+
+def write_file_atomic(filename: str, payload: bytes):
+    """Replace filename with payload, never leaving a partly written file"""
+    # Write beside the target and swap it in, so a crash never leaves a torn file
+    tmp_filename = filename + '.tmp'
+    try:
+        with open(tmp_filename, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        try:
+            os.remove(tmp_filename)
+        except OSError:
+            pass
+        raise
+
+
+def _validate_connection(connection: Any) -> Dict[str, Any]:
+    """Return the known connection settings from loaded config data, checking their types"""
+    if not isinstance(connection, dict):
+        raise ValueError("'connection' must be an object")
+    settings = {}
+    for key, value in connection.items():
+        expected = CONFIG_SCHEMA.get(key)
+        if expected is None:
+            continue  # unknown keys are ignored, as update_config does
+        if isinstance(value, bool) or not isinstance(value, expected):
+            raise ValueError(f"invalid value for '{key}': {value!r}")
+        settings[key] = value
+    return settings
+
+
+def _is_ch341(port) -> bool:
+    """Whether a pyserial ListPortInfo describes a CH340/CH341 adapter"""
+    # The USB vendor ID is exact where the OS reports it; the description
+    # match covers drivers that only name the chip
+    return port.vid == WCH_USB_VID or _CH341_DESCRIPTION.search(port.description or "") is not None
 
 
 class SerialPortInfo:
     """Container for serial port information"""
+    __slots__ = ('device', 'description', 'is_ch341')
+    
     def __init__(self, device: str, description: str, is_ch341: bool = False):
         self.device = device
         self.description = description
@@ -27,31 +126,68 @@ class SerialPortInfo:
 
 class SerialMessage:
     """Container for serial messages with metadata"""
+    __slots__ = ('data', 'msg_type', '_timestamp', '_time_ns')
+    
     def __init__(self, data: bytes, msg_type: str = "RECEIVED", timestamp: Optional[datetime] = None):
         self.data = data
         self.msg_type = msg_type
-        self.timestamp = timestamp or datetime.now()
+        # Only the raw clock is read here; the datetime is built on first use
+        self._timestamp = timestamp
+        self._time_ns = 0 if timestamp else time.time_ns()
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Local time the message was created (or the one passed in)"""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self._time_ns / 1e9)
+        return self._timestamp
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime):
+        self._timestamp = value
         
     def decode_text(self, encoding: str = 'utf-8') -> str:
         """Decode data as text, with fallback to hex representation"""
         try:
             return self.data.decode(encoding, errors='replace')
         except:
-            return ' '.join([f'{b:02X}' for b in self.data])
+            return self.data.hex(' ').upper()
     
     def to_hex_string(self) -> str:
         """Convert data to hex string representation"""
-        return ' '.join([f'{b:02X}' for b in self.data])
+        return self.data.hex(' ').upper()
 
 
 class UARTBackend:
     """Backend class for UART communication with CH341 devices"""
     
+    # Read timeout used by the reader thread; bounds how long a blocking
+    # read can delay noticing the stop flag
+    READ_TIMEOUT = 0.05
+    
+    # Driver buffer sizes requested where supported (Windows) and the
+    # largest single read the reader thread issues
+    RX_BUFFER_SIZE = 1 << 16
+    TX_BUFFER_SIZE = 1 << 12
+    MAX_READ_SIZE = 1 << 16
+    
     def __init__(self):
         self.serial_connection: Optional[serial.Serial] = None
-        self.is_connected = False
+        # One reader thread serves every connection: it parks on
+        # _connected_event between sessions and exits only on shutdown()
         self.read_thread: Optional[threading.Thread] = None
-        self.stop_reading = False
+        self._connected_event = threading.Event()
+        self._session_lock = threading.Lock()  # held while a session is read
+        self._quit = False
+        
+        # Optional framing: when set (e.g. b'\n'), received data is handed
+        # to on_data_received one complete frame per message, delimiter
+        # included. Set it before connect(); the reader thread reads it once
+        # per connection in _read_session(). An unterminated tail is flushed
+        # when it reaches MAX_READ_SIZE and when the connection closes.
+        # SerialGUIBridge joins every RECEIVED message into one buffer for
+        # the terminal, so framing only matters to callbacks of your own.
+        self.rx_delimiter: Optional[bytes] = None
         
         # Callbacks for events
         self.on_data_received: Optional[Callable[[SerialMessage], None]] = None
@@ -68,9 +204,17 @@ class UARTBackend:
             'timeout': 1
         }
         
-        # Command history
-        self.command_history: List[str] = []
+        # Command history, bounded by max_history; the set mirrors the
+        # deque for O(1) duplicate checks
         self.max_history = 100
+        self.command_history: Deque[str] = deque(maxlen=self.max_history)
+        self._history_set: Set[str] = set()
+    
+    @property
+    def is_connected(self) -> bool:
+        """Whether a serial port is currently open"""
+        connection = self.serial_connection
+        return connection is not None and connection.is_open
     
     def set_data_received_callback(self, callback: Callable[[SerialMessage], None]):
         """Set callback for when data is received"""
@@ -86,15 +230,14 @@ class UARTBackend:
     
     def get_available_ports(self) -> List[SerialPortInfo]:
         """Get list of available serial ports, highlighting CH341 devices"""
-        ports = []
-        for port in serial.tools.list_ports.comports():
-            is_ch341 = "CH340" in port.description or "CH341" in port.description
-            ports.append(SerialPortInfo(port.device, port.description, is_ch341))
-        return ports
+        return [SerialPortInfo(port.device, port.description, _is_ch341(port))
+                for port in serial.tools.list_ports.comports()]
     
     def get_ch341_ports(self) -> List[SerialPortInfo]:
         """Get list of CH341 devices only"""
-        return [port for port in self.get_available_ports() if port.is_ch341]
+        # Filter during the single enumeration; non-CH341 ports are never wrapped
+        return [SerialPortInfo(port.device, port.description, True)
+                for port in serial.tools.list_ports.comports() if _is_ch341(port)]
     
     def update_config(self, **kwargs):
         """Update connection configuration"""
@@ -104,23 +247,11 @@ class UARTBackend:
     
     def get_parity_constant(self, parity_str: str) -> int:
         """Convert parity string to pyserial constant"""
-        parity_map = {
-            "None": serial.PARITY_NONE,
-            "Even": serial.PARITY_EVEN,
-            "Odd": serial.PARITY_ODD,
-            "Mark": serial.PARITY_MARK,
-            "Space": serial.PARITY_SPACE
-        }
-        return parity_map.get(parity_str, serial.PARITY_NONE)
+        return PARITY_MAP.get(parity_str, serial.PARITY_NONE)
     
     def get_stopbits_constant(self, stopbits_str: str) -> float:
         """Convert stopbits string to pyserial constant"""
-        stopbits_map = {
-            "1": serial.STOPBITS_ONE,
-            "1.5": serial.STOPBITS_ONE_POINT_FIVE,
-            "2": serial.STOPBITS_TWO
-        }
-        return stopbits_map.get(stopbits_str, serial.STOPBITS_ONE)
+        return STOPBITS_MAP.get(stopbits_str, serial.STOPBITS_ONE)
     
     def connect(self, port: str = None) -> bool:
         """Connect to serial port"""
@@ -135,23 +266,34 @@ class UARTBackend:
                     self.on_error_occurred("No port specified")
                 return False
             
-            # Create serial connection
-            self.serial_connection = serial.Serial(
-                port=target_port,
-                baudrate=self.config['baudrate'],
-                bytesize=self.config['bytesize'],
-                parity=self.get_parity_constant(self.config['parity']),
-                stopbits=self.get_stopbits_constant(self.config['stopbits']),
-                timeout=self.config['timeout']
-            )
+            # Reuse one serial object across reconnects: apply the current
+            # settings to it and reopen it rather than building a new one
+            connection = self.serial_connection
+            if connection is None:
+                connection = self.serial_connection = serial.Serial()
+            connection.port = target_port
+            connection.baudrate = self.config['baudrate']
+            connection.bytesize = self.config['bytesize']
+            connection.parity = self.get_parity_constant(self.config['parity'])
+            connection.stopbits = self.get_stopbits_constant(self.config['stopbits'])
+            connection.timeout = self.config['timeout']
+            connection.open()
+            
+            # Give the driver room to buffer high baud rate bursts between reads
+            try:
+                self.serial_connection.set_buffer_size(rx_size=self.RX_BUFFER_SIZE,
+                                                       tx_size=self.TX_BUFFER_SIZE)
+            except AttributeError:
+                pass  # Only available on Windows
             
-            self.is_connected = True
             self.config['port'] = target_port
             
-            # Start reading thread
-            self.stop_reading = False
-            self.read_thread = threading.Thread(target=self._read_serial_data, daemon=True)
-            self.read_thread.start()
+            # Wake the reader thread, starting it on first use
+            if self.read_thread is None or not self.read_thread.is_alive():
+                self._quit = False
+                self.read_thread = threading.Thread(target=self._read_serial_data, daemon=True)
+                self.read_thread.start()
+            self._connected_event.set()
             
             # Notify connection status change
             if self.on_connection_changed:
@@ -171,16 +313,19 @@ class UARTBackend:
             return True
         
         try:
-            # Stop reading thread
-            self.stop_reading = True
-            if self.read_thread and self.read_thread.is_alive():
-                self.read_thread.join(timeout=1)
-            
-            # Close serial connection
+            # Park the reader thread, waking it from its blocking read
+            self._connected_event.clear()
             if self.serial_connection and self.serial_connection.is_open:
-                self.serial_connection.close()
+                self.serial_connection.cancel_read()
             
-            self.is_connected = False
+            # Close serial connection once the reader has let go of it
+            parked = self._session_lock.acquire(timeout=1)
+            try:
+                if self.serial_connection and self.serial_connection.is_open:
+                    self.serial_connection.close()
+            finally:
+                if parked:
+                    self._session_lock.release()
             
             # Notify connection status change
             if self.on_connection_changed:
@@ -194,21 +339,81 @@ class UARTBackend:
                 self.on_error_occurred(error_msg)
             return False
     
+    def shutdown(self):
+        """Disconnect and stop the reader thread for good"""
+        self.disconnect()
+        self._quit = True
+        self._connected_event.set()
+        if self.read_thread and self.read_thread.is_alive():
+            self.read_thread.join(timeout=1)
+    
     def _read_serial_data(self):
         """Read data from serial port in background thread"""
-        while not self.stop_reading and self.is_connected:
+        while True:
+            self._connected_event.wait()
+            if self._quit:
+                break
+            with self._session_lock:
+                # disconnect() may have run between the wake-up and the lock
+                if self._connected_event.is_set():
+                    self._read_session(self.serial_connection)
+    
+    def _read_session(self, connection: serial.Serial):
+        """Read one connection until disconnect() parks the reader"""
+        connection.timeout = self.READ_TIMEOUT
+        
+        # Everything the loop touches per chunk, bound once per session;
+        # the callback is still looked up per chunk so it can be swapped
+        connected = self._connected_event.is_set
+        read = connection.read
+        max_read = self.MAX_READ_SIZE
+        delimiter = self.rx_delimiter
+        pending = bytearray()  # bytes after the last delimiter seen
+        
+        def deliver(data: bytes):
+            callback = self.on_data_received
+            if callback:
+                callback(SerialMessage(data, "RECEIVED"))
+        
+        while connected():
             try:
-                if self.serial_connection and self.serial_connection.is_open:
-                    if self.serial_connection.in_waiting > 0:
-                        data = self.serial_connection.read(self.serial_connection.in_waiting)
-                        if data and self.on_data_received:
-                            message = SerialMessage(data, "RECEIVED")
-                            self.on_data_received(message)
-                time.sleep(0.01)  # Small delay to prevent high CPU usage
+                # Sleep in the driver until the first byte arrives, then
+                # drain everything that came with it in a single read
+                data = read(1)
+                if not data:
+                    continue
+                waiting = connection.in_waiting
+                if waiting:
+                    data += read(min(waiting, max_read))
+                
+                if not delimiter:
+                    deliver(data)
+                    continue
+                
+                pending += data
+                start = 0
+                end = pending.find(delimiter)
+                while end != -1:
+                    end += len(delimiter)
+                    deliver(bytes(pending[start:end]))
+                    start = end
+                    end = pending.find(delimiter, start)
+                del pending[:start]
+                
+                # Never hold more than one read's worth waiting for a delimiter
+                if len(pending) >= max_read:
+                    deliver(bytes(pending))
+                    pending.clear()
             except Exception as e:
-                if self.is_connected and self.on_error_occurred:
+                if self._connected_event.is_set() and self.on_error_occurred:
                     self.on_error_occurred(f"Read error: {str(e)}")
+                # Stop reading this connection until the next connect()
+                self._connected_event.clear()
                 break
+        
+        # Hand out an unterminated tail rather than dropping it
+        if pending:
+            deliver(bytes(pending))
     
     def send_data(self, data: bytes) -> bool:
         """Send raw bytes over serial"""
@@ -235,29 +440,35 @@ class UARTBackend:
             self.add_to_history(command)
             
             # Process command based on format
-            if format_type.upper() == "HEX":
-                # Remove spaces and convert hex string to bytes
-                hex_string = command.replace(" ", "")
-                if len(hex_string) % 2 != 0:
-                    if self.on_error_occurred:
-                        self.on_error_occurred("Hex string must have even number of characters")
-                    return False
-                data = bytes.fromhex(hex_string)
+            is_hex = format_type.upper() == "HEX"
+            if is_hex:
+                try:
+                    # fromhex skips whitespace between byte pairs by itself
+                    data = bytes.fromhex(command)
+                except ValueError:
+                    # Whitespace inside a pair ("0 1") needs stripping first
+                    hex_string = command.translate(_HEX_STRIP)
+                    if len(hex_string) % 2 != 0:
+                        if self.on_error_occurred:
+                            self.on_error_occurred("Hex string must have even number of characters")
+                        return False
+                    data = bytes.fromhex(hex_string)
             else:
                 # ASCII format
                 data = command.encode('utf-8')
                 
                 # Add line ending if specified
-                if line_ending != "None":
-                    line_ending_bytes = line_ending.replace("\\r", "\r").replace("\\n", "\n")
-                    data += line_ending_bytes.encode('utf-8')
+                line_ending_bytes = LINE_ENDINGS.get(line_ending)
+                if line_ending_bytes is None:
+                    line_ending_bytes = line_ending.replace("\\r", "\r").replace("\\n", "\n").encode('utf-8')
+                data += line_ending_bytes
             
             # Send data
             success = self.send_data(data)
             
             # Create sent message for logging
             if success and self.on_data_received:
-                display_command = f"HEX: {command}" if format_type.upper() == "HEX" else command
+                display_command = f"HEX: {command}" if is_hex else command
                 sent_message = SerialMessage(display_command.encode('utf-8'), "SENT")
                 self.on_data_received(sent_message)
             
@@ -270,29 +481,35 @@ class UARTBackend:
     
     def add_to_history(self, command: str):
         """Add command to history, maintaining max size"""
-        if command and command not in self.command_history:
+        if command and command not in self._history_set:
+            # The deque drops its oldest entry when full; keep the set in step
+            if len(self.command_history) == self.command_history.maxlen:
+                self._history_set.discard(self.command_history[0])
             self.command_history.append(command)
-            # Keep history within limits
-            if len(self.command_history) > self.max_history:
-                self.command_history = self.command_history[-self.max_history:]
+            self._history_set.add(command)
+    
+    def _set_history(self, commands: Iterable[str]):
+        """Replace command history, keeping the newest max_history entries"""
+        self.command_history = deque(commands, maxlen=self.max_history)
+        self._history_set = set(self.command_history)
     
     def get_history(self) -> List[str]:
         """Get command history"""
-        return self.command_history.copy()
+        return list(self.command_history)
     
     def clear_history(self):
         """Clear command history"""
         self.command_history.clear()
+        self._history_set.clear()
     
     def save_config(self, filename: str) -> bool:
         """Save current configuration to file"""
         try:
             config_data = {
                 'connection': self.config.copy(),
-                'history': self.command_history
+                'history': list(self.command_history)
             }
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2)
+            _write_json(filename, config_data)
             return True
         except Exception as e:
             if self.on_error_occurred:
@@ -302,14 +519,23 @@ class UARTBackend:
     def load_config(self, filename: str) -> bool:
         """Load configuration from file"""
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            with open(filename, 'rb') as f:
+                raw = f.read()
+            config_data = orjson.loads(raw) if orjson else json.loads(raw)
             
-            if 'connection' in config_data:
-                self.config.update(config_data['connection'])
+            # Check everything before applying anything, so a bad file
+            # leaves the current settings untouched
+            if not isinstance(config_data, dict):
+                raise ValueError("expected a JSON object")
+            connection = _validate_connection(config_data.get('connection', {}))
+            history = config_data.get('history')
+            if history is not None and not (isinstance(history, list) and
+                                            all(isinstance(command, str) for command in history)):
+                raise ValueError("'history' must be a list of strings")
             
-            if 'history' in config_data:
-                self.command_history = config_data['history']
+            self.config.update(connection)
+            if history is not None:
+                self._set_history(history)
             
             return True
         except Exception as e:
@@ -326,10 +552,12 @@ class UARTBackend:
             'config': self.config.copy()
         }
     
-    def __del__(self):
-        """Cleanup on object destruction"""
-        if self.is_connected:
-            self.disconnect()
+    def __enter__(self) -> 'UARTBackend':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Disconnect and stop the reader thread when the with block ends"""
+        self.shutdown()
 
 
 class QuickCommandsManager:
@@ -337,6 +565,8 @@ class QuickCommandsManager:
     
     def __init__(self):
         self.commands: List[str] = []
+        # Mirrors self.commands for O(1) duplicate checks
+        self._command_set: Set[str] = set()
         self.load_defaults()
     
     def load_defaults(self):
@@ -356,26 +586,29 @@ class QuickCommandsManager:
             "ping"
         ]
         self.commands = default_commands.copy()
+        self._command_set = set(self.commands)
     
     def add_command(self, command: str) -> bool:
         """Add command to quick commands"""
         command = command.strip()
-        if command and command not in self.commands:
+        if command and command not in self._command_set:
             self.commands.append(command)
+            self._command_set.add(command)
             return True
         return False
     
     def remove_command(self, command: str) -> bool:
         """Remove command from quick commands"""
-        if command in self.commands:
+        if command in self._command_set:
             self.commands.remove(command)
+            self._command_set.discard(command)
             return True
         return False
     
     def remove_command_at_index(self, index: int) -> bool:
         """Remove command at specific index"""
         if 0 <= index < len(self.commands):
-            del self.commands[index]
+            self._command_set.discard(self.commands.pop(index))
             return True
         return False
     
@@ -383,24 +616,42 @@ class QuickCommandsManager:
         """Get list of quick commands"""
         return self.commands.copy()
     
+    def set_commands(self, commands: List[str]):
+        """Replace all quick commands"""
+        self.commands = list(commands)
+        self._command_set = set(self.commands)
+    
     def clear_commands(self):
         """Clear all commands"""
         self.commands.clear()
+        self._command_set.clear()
     
     def save_to_file(self, filename: str) -> bool:
         """Save commands to JSON file"""
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.commands, f, indent=2)
+            self.write_file(filename)
             return True
         except Exception:
             return False
     
+    def write_file(self, filename: str):
+        """Save commands to JSON file, raising on failure"""
+        _write_json(filename, self.commands)
+    
     def load_from_file(self, filename: str) -> bool:
         """Load commands from JSON file"""
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                self.commands = json.load(f)
+            self.set_commands(self.read_file(filename))
             return True
         except Exception:
             return False
+    
+    @staticmethod
+    def read_file(filename: str) -> List[str]:
+        """Read a JSON command list, raising ValueError unless it is a list of strings"""
+        with open(filename, 'rb') as f:
+            raw = f.read()
+        commands = orjson.loads(raw) if orjson else json.loads(raw)
+        if not (isinstance(commands, list) and all(isinstance(command, str) for command in commands)):
+            raise ValueError("expected a JSON list of strings")
+        return commands
@@ -5,36 +5,74 @@ PyQt6-based GUI interface that uses the uart_backend module
 """
 
 import sys
+import os
+import time
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                              QGridLayout, QWidget, QLabel, QComboBox, QPushButton, 
-                             QLineEdit, QTextEdit, QListWidget, QCheckBox, QGroupBox,
+                             QLineEdit, QPlainTextEdit, QListView, QCheckBox, QGroupBox,
                              QMessageBox, QFileDialog, QSplitter, QFrame)
-from PyQt6.QtCore import QThread, pyqtSignal, QTimer, Qt, QObject
-from PyQt6.QtGui import QFont, QTextCursor, QColor
-from datetime import datetime
-from typing import Optional, List
+from PyQt6.QtCore import (QThread, pyqtSignal, QTimer, Qt, QObject, QMutex,
+                          QRunnable, QThreadPool, QStringListModel, QSignalBlocker)
+from PyQt6.QtGui import QFont, QTextCursor, QColor, QTextCharFormat
+from typing import Any, Callable, Optional, List, Union
 
-from uart_backend import UARTBackend, SerialMessage, SerialPortInfo, QuickCommandsManager
+from uart_backend import (UARTBackend, SerialMessage, SerialPortInfo, QuickCommandsManager,
+                          write_file_atomic)
 from plugin_system import PluginManager
 
 
+# Bytes expected in text: tab/newline/CR etc., printable ASCII, and the
+# 0x80-0xFF range so UTF-8 encoded text is not mistaken for binary
+_TEXT_BYTES = bytes(range(9, 14)) + bytes(range(32, 127)) + bytes(range(128, 256))
+
+
 class SerialGUIBridge(QObject):
     """Bridge to convert backend callbacks to Qt signals"""
     data_received = pyqtSignal(object)  # SerialMessage
     connection_changed = pyqtSignal(bool, str)  # connected, status_text
     error_occurred = pyqtSignal(str)  # error_message
+    rx_backlog = pyqtSignal()  # pending received bytes crossed RX_HIGH_WATERMARK
+    
+    RX_HIGH_WATERMARK = 4096  # bytes
     
     def __init__(self, backend: UARTBackend):
         super().__init__()
         self.backend = backend
         
+        # Received bytes waiting for the GUI to pull them with take_received()
+        self._rx_buffer = bytearray()
+        self._rx_mutex = QMutex()
+        
         # Connect backend callbacks to Qt signals
         self.backend.set_data_received_callback(self._on_data_received)
         self.backend.set_connection_changed_callback(self._on_connection_changed)
         self.backend.set_error_callback(self._on_error_occurred)
     
     def _on_data_received(self, message: SerialMessage):
-        self.data_received.emit(message)
+        if message.msg_type != "RECEIVED":
+            self.data_received.emit(message)
+            return
+        
+        # Called on the reader thread: accumulate instead of emitting per read
+        self._rx_mutex.lock()
+        try:
+            before = len(self._rx_buffer)
+            self._rx_buffer += message.data
+            crossed = before < self.RX_HIGH_WATERMARK <= len(self._rx_buffer)
+        finally:
+            self._rx_mutex.unlock()
+        
+        if crossed:
+            self.rx_backlog.emit()
+    
+    def take_received(self) -> bytes:
+        """Return and clear the bytes received since the last call"""
+        self._rx_mutex.lock()
+        try:
+            data, self._rx_buffer = self._rx_buffer, bytearray()
+        finally:
+            self._rx_mutex.unlock()
+        return bytes(data)
     
     def _on_connection_changed(self, connected: bool, status: str):
         self.connection_changed.emit(connected, status)
@@ -43,9 +81,65 @@ class SerialGUIBridge(QObject):
         self.error_occurred.emit(error_msg)
 
 
+class FileTaskSignals(QObject):
+    """Results posted back to the GUI thread by file tasks"""
+    finished = pyqtSignal(str, object)  # filename, result (None for writes)
+    failed = pyqtSignal(str, str)  # filename, error_message
+
+
+class _FileTask(QRunnable):
+    """Run one file operation on the thread pool"""
+    
+    def __init__(self, filename: str, job: Callable[[str], Any]):
+        super().__init__()
+        self.filename = filename
+        self.job = job
+        self.signals = FileTaskSignals()
+    
+    def run(self):
+        try:
+            result = self.job(self.filename)
+        except Exception as e:
+            self.signals.failed.emit(self.filename, str(e))
+        else:
+            self.signals.finished.emit(self.filename, result)
+
+
+class PortScanThread(QThread):
+    """Enumerate serial ports off the GUI thread"""
+    ports_scanned = pyqtSignal(list)  # List[SerialPortInfo]
+    
+    def __init__(self, backend: UARTBackend, parent=None):
+        super().__init__(parent)
+        self.backend = backend
+    
+    def run(self):
+        self.ports_scanned.emit(self.backend.get_available_ports())
+
+
 class UARTCommandSenderGUI(QMainWindow):
     """Main GUI class for UART Command Sender"""
     
+    # Received-data flush timer (ms): normal, under load, and after idling
+    RX_FLUSH_INTERVAL_MS = 30
+    RX_FLUSH_BUSY_MS = 15
+    RX_FLUSH_IDLE_MS = 100
+    RX_IDLE_TICKS = 10  # empty ticks before slowing down
+    
+    CONFIG_DEBOUNCE_MS = 150  # settle time for serial settings combos
+    
+    TERMINAL_MAX_LINES = 5000  # older lines are dropped beyond this
+    PLUGIN_RESPONSE_MAX_LINES = 200
+    
+    # Terminal color coding based on message type
+    LOG_COLORS = {
+        "SENT": "#0066cc",     # Blue
+        "RECEIVED": "#008000", # Green
+        "ERROR": "#cc0000",    # Red
+        "SYSTEM": "#800080",   # Purple
+        "INFO": "#000000"      # Black
+    }
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("UART Command Sender - CH341 (Modular)")
@@ -59,13 +153,56 @@ class UARTCommandSenderGUI(QMainWindow):
         self.plugin_manager = PluginManager()
         self.plugin_manager.load_plugins()
         
-        # Command history for GUI navigation
-        self.history_index = -1
+        # Parameter input widgets for the selected plugin command, by name,
+        # with the parameter's declared type
+        self._param_widgets = {}
+        
+        # Parameter pages built so far, keyed by (plugin, command); switching
+        # commands shows a cached page instead of rebuilding its widgets
+        self._param_pages = {}
+        self._param_page = None
+        
+        # Command history for GUI navigation: a list copy taken on the first
+        # arrow key press and dropped after the next send
+        self._hist_snapshot = None
+        self._hist_pos = 0
+        
+        # "HH:MM:SS" for the current second, reformatted only when it changes
+        self._ts_sec = None
+        self._ts_hhmmss = ""
+        
+        # One character format per message type, reused for every insert
+        self._log_formats = {}
+        for msg_type, color in self.LOG_COLORS.items():
+            char_format = QTextCharFormat()
+            char_format.setForeground(QColor(color))
+            self._log_formats[msg_type] = char_format
         
         # Connect backend signals to GUI slots
         self.gui_bridge.data_received.connect(self.handle_data_received)
         self.gui_bridge.connection_changed.connect(self.handle_connection_changed)
         self.gui_bridge.error_occurred.connect(self.handle_error)
+        self.gui_bridge.rx_backlog.connect(self._flush_rx)
+        
+        # Pull received bytes from the bridge on a timer, so a burst of
+        # reads turns into a single terminal update
+        self._rx_idle_ticks = 0
+        self.rx_flush_timer = QTimer(self)
+        self.rx_flush_timer.timeout.connect(self._flush_rx)
+        self.rx_flush_timer.start(self.RX_FLUSH_INTERVAL_MS)
+        
+        # Serial settings changes are applied once the combos settle
+        self.config_debounce_timer = QTimer(self)
+        self.config_debounce_timer.setSingleShot(True)
+        self.config_debounce_timer.timeout.connect(self._apply_backend_config)
+        
+        # File saves/loads running on the thread pool
+        self._file_tasks = set()
+        
+        # Ports currently shown in the combo, keyed by device
+        self._ports = {}
+        self.port_scan_thread = PortScanThread(self.backend, self)
+        self.port_scan_thread.ports_scanned.connect(self.update_ports)
         
         self.setup_ui()
         self.refresh_ports()
@@ -190,14 +327,20 @@ class UARTCommandSenderGUI(QMainWindow):
         self.line_ending_combo = QComboBox()
         self.line_ending_combo.addItems(["None", "\\r", "\\n", "\\r\\n"])
         self.line_ending_combo.setCurrentText("\\r\\n")
+        self.line_ending_combo.currentTextChanged.connect(self._update_line_ending)
         options_layout.addWidget(self.line_ending_combo)
         
         # Format
         options_layout.addWidget(QLabel("Format:"))
         self.format_combo = QComboBox()
         self.format_combo.addItems(["ASCII", "HEX"])
+        self.format_combo.currentTextChanged.connect(self._update_format)
         options_layout.addWidget(self.format_combo)
         
+        # Send options are cached here and kept current by the combo signals
+        self._update_line_ending(self.line_ending_combo.currentText())
+        self._update_format(self.format_combo.currentText())
+        
         # Auto scroll
         self.auto_scroll_checkbox = QCheckBox("Auto Scroll")
         self.auto_scroll_checkbox.setChecked(True)
@@ -242,9 +385,11 @@ class UARTCommandSenderGUI(QMainWindow):
         plugin_layout.addWidget(self.send_plugin_button, 3, 0, 1, 3)
         
         # Response parsing area
-        self.plugin_response_text = QTextEdit()
+        self.plugin_response_text = QPlainTextEdit()
         self.plugin_response_text.setMaximumHeight(100)
         self.plugin_response_text.setReadOnly(True)
+        self.plugin_response_text.setMaximumBlockCount(self.PLUGIN_RESPONSE_MAX_LINES)
+        self.plugin_response_text.setUndoRedoEnabled(False)
         self.plugin_response_text.setPlaceholderText("Plugin response parsing will appear here...")
         plugin_layout.addWidget(QLabel("Parsed Response:"), 4, 0)
         plugin_layout.addWidget(self.plugin_response_text, 5, 0, 1, 3)
@@ -264,9 +409,11 @@ class UARTCommandSenderGUI(QMainWindow):
         terminal_layout = QVBoxLayout(terminal_group)
         
         # Terminal text area
-        self.terminal_text = QTextEdit()
+        self.terminal_text = QPlainTextEdit()
         self.terminal_text.setFont(QFont("Consolas", 9))
         self.terminal_text.setReadOnly(True)
+        self.terminal_text.setMaximumBlockCount(self.TERMINAL_MAX_LINES)
+        self.terminal_text.setUndoRedoEnabled(False)
         terminal_layout.addWidget(self.terminal_text)
         
         # Terminal control buttons
@@ -299,9 +446,12 @@ class UARTCommandSenderGUI(QMainWindow):
         quick_layout = QVBoxLayout(quick_group)
         
         # Quick commands list
-        self.quick_commands_list = QListWidget()
+        self.quick_commands_model = QStringListModel(self)
+        self.quick_commands_list = QListView()
+        self.quick_commands_list.setModel(self.quick_commands_model)
+        self.quick_commands_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
         self.quick_commands_list.setFont(QFont("Consolas", 9))
-        self.quick_commands_list.itemDoubleClicked.connect(self.send_quick_command)
+        self.quick_commands_list.doubleClicked.connect(self.send_quick_command)
         quick_layout.addWidget(self.quick_commands_list)
         
         # Quick commands control buttons
@@ -340,6 +490,12 @@ class UARTCommandSenderGUI(QMainWindow):
     
     def update_backend_config(self):
         """Update backend configuration when GUI settings change"""
+        # Restarting the timer folds a run of changes into one update
+        self.config_debounce_timer.start(self.CONFIG_DEBOUNCE_MS)
+    
+    def _apply_backend_config(self):
+        """Push the serial settings shown in the GUI to the backend"""
+        self.config_debounce_timer.stop()
         self.backend.update_config(
             baudrate=int(self.baud_combo.currentText()),
             bytesize=int(self.databits_combo.currentText()),
@@ -348,19 +504,29 @@ class UARTCommandSenderGUI(QMainWindow):
         )
     
     def refresh_ports(self):
-        """Refresh the list of available serial ports"""
-        self.port_combo.clear()
-        ports = self.backend.get_available_ports()
-        
-        ch341_found = False
-        for i, port in enumerate(ports):
-            self.port_combo.addItem(str(port), port.device)
-            if port.is_ch341 and not ch341_found:
-                self.port_combo.setCurrentIndex(i)
-                ch341_found = True
-        
-        if not ch341_found and ports:
-            self.port_combo.setCurrentIndex(0)
+        """Refresh the list of available serial ports in the background"""
+        if not self.port_scan_thread.isRunning():
+            self.port_scan_thread.start()
+    
+    def update_ports(self, ports: List[SerialPortInfo]):
+        """Apply a port scan, touching only the entries that changed"""
+        scanned = {port.device: port for port in ports}
+        had_selection = self.port_combo.currentData() in scanned
+        
+        for device, port in list(self._ports.items()):
+            if device not in scanned or str(scanned[device]) != str(port):
+                self.port_combo.removeItem(self.port_combo.findData(device))
+                del self._ports[device]
+        
+        for device, port in scanned.items():
+            if device not in self._ports:
+                self.port_combo.addItem(str(port), device)
+                self._ports[device] = port
+        
+        # Keep the user's choice; otherwise prefer the first CH341 device
+        if not had_selection and ports:
+            ch341 = next((port for port in ports if port.is_ch341), ports[0])
+            self.port_combo.setCurrentIndex(self.port_combo.findData(ch341.device))
     
     def toggle_connection(self):
         """Toggle connection state"""
@@ -369,7 +535,7 @@ class UARTCommandSenderGUI(QMainWindow):
         else:
             port = self.port_combo.currentData()
             if port:
-                self.update_backend_config()
+                self._apply_backend_config()
                 self.backend.connect(port)
     
     def handle_connection_changed(self, connected: bool, status: str):
@@ -394,16 +560,23 @@ class UARTCommandSenderGUI(QMainWindow):
     
     def format_received_data(self, data: bytes, timestamp) -> str:
         """Format received data for display"""
-        try:
-            # Try to decode as text first
-            text = data.decode('utf-8', errors='replace')
-            # Show both text and hex for better debugging
-            hex_str = ' '.join(f'{b:02X}' for b in data)
-            return f"TEXT: {text} | HEX: {hex_str}"
-        except:
-            # Fall back to hex only
-            hex_str = ' '.join(f'{b:02X}' for b in data)
+        # Mostly control bytes: binary data, skip the text decode entirely
+        hex_str = data.hex(' ').upper()
+        non_text = len(data.translate(None, _TEXT_BYTES))
+        if non_text * 4 > len(data):
             return f"HEX: {hex_str}"
+        
+        # Show both text and hex for better debugging; 'replace' cannot raise
+        text = data.decode('utf-8', errors='replace')
+        return f"TEXT: {text} | HEX: {hex_str}"
+    
+    def _update_line_ending(self, text: str):
+        """Remember the selected line ending"""
+        self._line_ending = text
+    
+    def _update_format(self, text: str):
+        """Remember the selected send format"""
+        self._format_type = text
     
     def send_command(self):
         """Send command using backend"""
@@ -415,40 +588,43 @@ class UARTCommandSenderGUI(QMainWindow):
         if not command:
             return
         
-        format_type = self.format_combo.currentText()
-        line_ending = self.line_ending_combo.currentText()
-        
-        success = self.backend.send_command(command, format_type, line_ending)
+        success = self.backend.send_command(command, self._format_type, self._line_ending)
         if success:
             self.command_entry.clear()
-            # Reset history index
-            self.history_index = len(self.backend.get_history())
-    
-    def log_message(self, message: str, msg_type: str = "INFO", add_timestamp: bool = True):
-        """Add message to terminal output with color coding"""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3] if add_timestamp else ""
-        
-        # Color coding based on message type
-        color_map = {
-            "SENT": "#0066cc",     # Blue
-            "RECEIVED": "#008000", # Green
-            "ERROR": "#cc0000",    # Red
-            "SYSTEM": "#800080",   # Purple
-            "INFO": "#000000"      # Black
-        }
-        
-        # Format message
+            # History changed; the next arrow key press takes a fresh snapshot
+            self._hist_snapshot = None
+    
+    def log_message(self, message: Union[str, List[str]], msg_type: str = "INFO", add_timestamp: bool = True):
+        """Add one message, or a batch of messages of one type, to the terminal output with color coding"""
+        messages = [message] if isinstance(message, str) else message
+        if not messages:
+            return
+        
+        # Format messages
         if add_timestamp:
-            formatted_message = f"[{timestamp}] [{msg_type}] {message}"
+            now = time.time()
+            sec = int(now)
+            if sec != self._ts_sec:
+                self._ts_sec = sec
+                self._ts_hhmmss = time.strftime("%H:%M:%S", time.localtime(sec))
+            prefix = f"[{self._ts_hhmmss}.{int((now - sec) * 1000):03d}] [{msg_type}] "
+            text = "\n".join(prefix + m for m in messages)
         else:
-            formatted_message = message
+            text = "\n".join(messages)
         
-        # Insert message with color
+        # Insert the whole batch as plain text in a single edit
         cursor = self.terminal_text.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertHtml(f'<span style="color: {color_map.get(msg_type, "#000000")}">{formatted_message}</span><br>')
+        if not self.terminal_text.document().isEmpty():
+            text = "\n" + text
+        cursor.insertText(text, self._log_formats.get(msg_type, self._log_formats["INFO"]))
         
-        # Auto-scroll if enabled
+        # During a batched flush the scroll happens once, when it ends
+        if self.terminal_text.updatesEnabled():
+            self.scroll_terminal()
+    
+    def scroll_terminal(self):
+        """Scroll the terminal to the newest output if auto-scroll is enabled"""
         if self.auto_scroll_checkbox.isChecked():
             scrollbar = self.terminal_text.verticalScrollBar()
             if scrollbar:
@@ -460,47 +636,50 @@ class UARTCommandSenderGUI(QMainWindow):
     
     def history_up(self):
         """Navigate up in command history"""
-        history = self.backend.get_history()
-        if history and self.history_index > 0:
-            self.history_index -= 1
-            self.command_entry.setText(history[self.history_index])
+        if self._hist_snapshot is None:
+            self._hist_snapshot = list(self.backend.command_history)
+            self._hist_pos = len(self._hist_snapshot)
+        if self._hist_pos > 0:
+            self._hist_pos -= 1
+            self.command_entry.setText(self._hist_snapshot[self._hist_pos])
     
     def history_down(self):
         """Navigate down in command history"""
-        history = self.backend.get_history()
-        if history and self.history_index < len(history) - 1:
-            self.history_index += 1
-            self.command_entry.setText(history[self.history_index])
-        elif self.history_index >= len(history) - 1:
-            self.history_index = len(history)
+        history = self._hist_snapshot
+        if history is None:
+            return
+        if self._hist_pos < len(history) - 1:
+            self._hist_pos += 1
+            self.command_entry.setText(history[self._hist_pos])
+        else:
+            self._hist_pos = len(history)
             self.command_entry.clear()
     
     def load_quick_commands(self):
-        """Load quick commands into the list widget"""
-        self.quick_commands_list.clear()
-        for cmd in self.quick_commands.get_commands():
-            self.quick_commands_list.addItem(cmd)
+        """Load quick commands into the list view"""
+        self.quick_commands_model.setStringList(self.quick_commands.get_commands())
     
     def add_quick_command(self):
         """Add current command to quick commands"""
         command = self.command_entry.text().strip()
         if command and self.quick_commands.add_command(command):
-            self.quick_commands_list.addItem(command)
+            row = self.quick_commands_model.rowCount()
+            self.quick_commands_model.insertRows(row, 1)
+            self.quick_commands_model.setData(self.quick_commands_model.index(row), command)
     
     def remove_quick_command(self):
         """Remove selected quick command"""
-        current_row = self.quick_commands_list.currentRow()
-        if current_row >= 0:
-            item = self.quick_commands_list.takeItem(current_row)
-            if item:
-                self.quick_commands.remove_command(item.text())
+        index = self.quick_commands_list.currentIndex()
+        if index.isValid():
+            command = index.data()
+            self.quick_commands_model.removeRows(index.row(), 1)
+            self.quick_commands.remove_command(command)
     
     def send_quick_command(self):
         """Send selected quick command"""
-        current_item = self.quick_commands_list.currentItem()
-        if current_item:
-            command = current_item.text()
-            self.command_entry.setText(command)
+        index = self.quick_commands_list.currentIndex()
+        if index.isValid():
+            self.command_entry.setText(index.data())
             self.send_command()
     
     def save_log(self):
@@ -509,12 +688,13 @@ class UARTCommandSenderGUI(QMainWindow):
             self, "Save Log", "", "Text files (*.txt);;All files (*.*)"
         )
         if filename:
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.terminal_text.toPlainText())
-                QMessageBox.information(self, "Success", f"Log saved to {filename}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save log: {str(e)}")
+            data = self.terminal_text.toPlainText().replace("\n", os.linesep).encode('utf-8')
+            task = _FileTask(filename, lambda name: write_file_atomic(name, data))
+            task.signals.finished.connect(
+                lambda name, _: QMessageBox.information(self, "Success", f"Log saved to {name}"))
+            task.signals.failed.connect(
+                lambda name, error: QMessageBox.critical(self, "Error", f"Failed to save log: {error}"))
+            self._start_file_task(task)
     
     def save_commands(self):
         """Save quick commands to JSON file"""
@@ -522,10 +702,13 @@ class UARTCommandSenderGUI(QMainWindow):
             self, "Save Commands", "", "JSON files (*.json);;All files (*.*)"
         )
         if filename:
-            if self.quick_commands.save_to_file(filename):
-                QMessageBox.information(self, "Success", f"Commands saved to {filename}")
-            else:
-                QMessageBox.critical(self, "Error", "Failed to save commands")
+            # The manager owns the file format and replaces the file atomically
+            task = _FileTask(filename, self.quick_commands.write_file)
+            task.signals.finished.connect(
+                lambda name, _: QMessageBox.information(self, "Success", f"Commands saved to {name}"))
+            task.signals.failed.connect(
+                lambda name, error: QMessageBox.critical(self, "Error", "Failed to save commands"))
+            self._start_file_task(task)
     
     def load_commands(self):
         """Load quick commands from JSON file"""
@@ -533,36 +716,70 @@ class UARTCommandSenderGUI(QMainWindow):
             self, "Load Commands", "", "JSON files (*.json);;All files (*.*)"
         )
         if filename:
-            if self.quick_commands.load_from_file(filename):
-                self.load_quick_commands()
-                QMessageBox.information(self, "Success", f"Commands loaded from {filename}")
-            else:
-                QMessageBox.critical(self, "Error", "Failed to load commands")
+            # Parsed and checked on the pool; applied on the GUI thread
+            task = _FileTask(filename, QuickCommandsManager.read_file)
+            task.signals.finished.connect(self._on_commands_loaded)
+            task.signals.failed.connect(self._on_commands_load_failed)
+            self._start_file_task(task)
+    
+    def _on_commands_loaded(self, filename: str, commands: List[str]):
+        """Show quick commands read by QuickCommandsManager.read_file"""
+        self.quick_commands.set_commands(commands)
+        self.load_quick_commands()
+        QMessageBox.information(self, "Success", f"Commands loaded from {filename}")
+    
+    def _on_commands_load_failed(self, filename: str, error: str):
+        """Report a commands file that could not be read or is not a list of strings"""
+        self.log_message(f"Failed to load commands from {filename}: {error}", "ERROR")
+        QMessageBox.critical(self, "Error", f"Failed to load commands: {error}")
+    
+    def _start_file_task(self, task: QRunnable):
+        """Run a file task on the global thread pool, keeping it alive until it reports back"""
+        self._file_tasks.add(task)
+        task.signals.finished.connect(lambda *_: self._file_tasks.discard(task))
+        task.signals.failed.connect(lambda *_: self._file_tasks.discard(task))
+        QThreadPool.globalInstance().start(task)
     
     def refresh_plugins(self):
         """Refresh the plugin list"""
-        self.plugin_combo.clear()
-        self.plugin_combo.addItem("Select Plugin...")
-        
+        # Command tables are read once here and reused until the next refresh
         plugins = self.plugin_manager.get_all_plugins()
-        for plugin_name, plugin in plugins.items():
-            if plugin.enabled:
-                self.plugin_combo.addItem(plugin.name, plugin_name)
+        self._param_page = None
+        for page, _ in self._param_pages.values():
+            page.deleteLater()
+        self._param_pages.clear()
+        self._plugin_cmd_cache = {plugin_name: plugin.get_commands()
+                                  for plugin_name, plugin in plugins.items() if plugin.enabled}
+        
+        # Repopulate silently, then handle the resulting selection once
+        blocker = QSignalBlocker(self.plugin_combo)
+        try:
+            self.plugin_combo.clear()
+            self.plugin_combo.addItem("Select Plugin...")
+            
+            for plugin_name, plugin in plugins.items():
+                if plugin.enabled:
+                    self.plugin_combo.addItem(plugin.name, plugin_name)
+        finally:
+            blocker.unblock()
+        self.on_plugin_selected(self.plugin_combo.currentText())
     
     def on_plugin_selected(self, plugin_name: str):
         """Handle plugin selection change"""
-        self.plugin_command_combo.clear()
-        self.plugin_command_combo.addItem("Select Command...")
-        
-        # Clear previous parameter widgets
-        self.clear_plugin_params()
-        
-        if plugin_name and plugin_name != "Select Plugin...":
-            plugin = self.plugin_manager.get_plugin(self.plugin_combo.currentData())
-            if plugin:
-                commands = plugin.get_commands()
-                for command_name in commands.keys():
-                    self.plugin_command_combo.addItem(command_name, command_name)
+        # Repopulate silently, then handle the resulting selection once
+        blocker = QSignalBlocker(self.plugin_command_combo)
+        try:
+            self.plugin_command_combo.clear()
+            self.plugin_command_combo.addItem("Select Command...")
+            
+            if plugin_name and plugin_name != "Select Plugin...":
+                commands = self._plugin_cmd_cache.get(self.plugin_combo.currentData())
+                if commands:
+                    for command_name in commands.keys():
+                        self.plugin_command_combo.addItem(command_name, command_name)
+        finally:
+            blocker.unblock()
+        self.on_plugin_command_selected(self.plugin_command_combo.currentText())
     
     def on_plugin_command_selected(self, command_name: str):
         """Handle plugin command selection change"""
@@ -571,39 +788,50 @@ class UARTCommandSenderGUI(QMainWindow):
         
         if command_name and command_name != "Select Command...":
             plugin_name = self.plugin_combo.currentData()
-            if plugin_name:
-                plugin = self.plugin_manager.get_plugin(plugin_name)
-                if plugin:
-                    commands = plugin.get_commands()
-                    if command_name in commands:
-                        self.setup_plugin_params(commands[command_name])
-                        self.send_plugin_button.setEnabled(True)
-                        return
+            commands = self._plugin_cmd_cache.get(plugin_name)
+            if commands and command_name in commands:
+                self.setup_plugin_params(commands[command_name], (plugin_name, command_name))
+                self.send_plugin_button.setEnabled(True)
+                return
         
         self.send_plugin_button.setEnabled(False)
     
     def clear_plugin_params(self):
-        """Clear all parameter input widgets"""
-        while self.plugin_params_layout.count():
-            child = self.plugin_params_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-    
-    def setup_plugin_params(self, command_info):
-        """Setup parameter input widgets for the selected command"""
-        if 'parameters' not in command_info:
-            return
-            
+        """Hide the parameter inputs of the previously selected command"""
+        if self._param_page is not None:
+            self._param_page.hide()
+            self._param_page = None
+        self._param_widgets = {}
+    
+    def setup_plugin_params(self, command_info, key=None):
+        """Show parameter input widgets for the selected command, building them on first use"""
+        cached = self._param_pages.get(key)
+        if cached is None:
+            cached = self._build_param_page(command_info)
+            self.plugin_params_layout.addWidget(cached[0], 0, 0)
+            if key is not None:
+                self._param_pages[key] = cached
+        
+        self._param_page, self._param_widgets = cached
+        self._param_page.show()
+    
+    def _build_param_page(self, command_info):
+        """Create a page of parameter input widgets and return it with its name->widget map"""
+        page = QWidget()
+        page_layout = QGridLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        widgets = {}
+        
         row = 0
-        for param_name, param_info in command_info['parameters'].items():
+        for param_name, param_info in command_info.get('parameters', {}).items():
             # Add label
             label = QLabel(f"{param_name.replace('_', ' ').title()}:")
-            self.plugin_params_layout.addWidget(label, row, 0)
+            page_layout.addWidget(label, row, 0)
             
             # Add input widget based on parameter type
             if param_info['type'] == 'choice':
                 widget = QComboBox()
-                widget.addItems(param_info['choices'])
+                widget.addItems(list(param_info['choices']))
                 if 'default' in param_info:
                     index = widget.findText(str(param_info['default']))
                     if index >= 0:
@@ -625,8 +853,11 @@ class UARTCommandSenderGUI(QMainWindow):
                     widget.setText(str(param_info['default']))
             
             widget.setObjectName(param_name)
-            self.plugin_params_layout.addWidget(widget, row, 1)
+            page_layout.addWidget(widget, row, 1)
+            widgets[param_name] = (widget, param_info['type'])
             row += 1
+        
+        return page, widgets
     
     def send_plugin_command(self):
         """Send command from the selected plugin"""
@@ -646,19 +877,23 @@ class UARTCommandSenderGUI(QMainWindow):
         
         # Collect parameters from the UI
         parameters = {}
-        for i in range(self.plugin_params_layout.count()):
-            widget = self.plugin_params_layout.itemAt(i).widget()
-            if widget and hasattr(widget, 'objectName') and widget.objectName():
-                param_name = widget.objectName()
-                if isinstance(widget, QComboBox):
-                    parameters[param_name] = widget.currentText()
-                elif isinstance(widget, QLineEdit):
-                    text = widget.text()
-                    # Try to convert to int if it looks like a number
-                    if text.isdigit() or (text.startswith('-') and text[1:].isdigit()):
-                        parameters[param_name] = int(text)
-                    else:
-                        parameters[param_name] = text
+        for param_name, (widget, param_type) in self._param_widgets.items():
+            if isinstance(widget, QComboBox):
+                parameters[param_name] = widget.currentText()
+                continue
+            
+            text = widget.text()
+            if param_type == 'int':
+                # Leave bad input as text for the plugin's validation to reject
+                try:
+                    parameters[param_name] = int(text)
+                except ValueError:
+                    parameters[param_name] = text
+            # Try to convert to int if it looks like a number
+            elif text.isdigit() or (text.startswith('-') and text[1:].isdigit()):
+                parameters[param_name] = int(text)
+            else:
+                parameters[param_name] = text
         
         try:
             # Execute plugin command
@@ -668,7 +903,7 @@ class UARTCommandSenderGUI(QMainWindow):
                 self.backend.send_data(command_bytes)
                 
                 # Format bytes for display
-                hex_display = ' '.join(f'{b:02X}' for b in command_bytes)
+                hex_display = command_bytes.hex(' ').upper()
                 self.log_message(f"PLUGIN SENT [{plugin.name}:{command_name}]: {hex_display}", "SENT")
                 
                 # Store last plugin response handler for parsing incoming data
@@ -679,8 +914,40 @@ class UARTCommandSenderGUI(QMainWindow):
         except Exception as e:
             self.log_message(f"ERROR: Plugin command failed: {str(e)}", "ERROR")
     
+    def _flush_rx(self):
+        """Display bytes received since the last tick and adapt the tick rate"""
+        data = self.gui_bridge.take_received()
+        
+        if data:
+            self._rx_idle_ticks = 0
+            if len(data) >= self.gui_bridge.RX_HIGH_WATERMARK:
+                interval = self.RX_FLUSH_BUSY_MS
+            else:
+                interval = self.RX_FLUSH_INTERVAL_MS
+            
+            # Hold repaints until the whole chunk is in, then scroll once
+            self.terminal_text.setUpdatesEnabled(False)
+            try:
+                self.handle_data_received(SerialMessage(data, "RECEIVED"))
+            finally:
+                self.terminal_text.setUpdatesEnabled(True)
+                self.scroll_terminal()
+        else:
+            self._rx_idle_ticks += 1
+            if self._rx_idle_ticks >= self.RX_IDLE_TICKS:
+                interval = self.RX_FLUSH_IDLE_MS
+            else:
+                interval = self.rx_flush_timer.interval()
+        
+        if interval != self.rx_flush_timer.interval():
+            self.rx_flush_timer.setInterval(interval)
+    
     def handle_data_received(self, message: SerialMessage):
         """Handle received data from serial port"""
+        # Show anything still pending ahead of a sent message, keeping order
+        if message.msg_type != "RECEIVED":
+            self._flush_rx()
+        
         # Display the raw data
         formatted_data = self.format_received_data(message.data, message.timestamp)
         self.log_message(formatted_data, "RECEIVED")
@@ -695,15 +962,12 @@ class UARTCommandSenderGUI(QMainWindow):
                     for key, value in parsed_response.items():
                         response_text += f"{key}: {value}\n"
                     
-                    current_text = self.plugin_response_text.toPlainText()
-                    if current_text:
-                        current_text += "\n"
-                    current_text += f"[{message.timestamp.strftime('%H:%M:%S')}] {response_text.strip()}"
-                    self.plugin_response_text.setPlainText(current_text)
-                      # Scroll to bottom
-                    cursor = self.plugin_response_text.textCursor()
-                    cursor.movePosition(QTextCursor.MoveOperation.End)
-                    self.plugin_response_text.setTextCursor(cursor)
+                    # Append at the end; the widget trims old lines itself
+                    self.plugin_response_text.appendPlainText(
+                        f"[{message.timestamp.strftime('%H:%M:%S')}] {response_text.strip()}")
+                    # Scroll to bottom
+                    scrollbar = self.plugin_response_text.verticalScrollBar()
+                    scrollbar.setValue(scrollbar.maximum())
                     
             except Exception as e:
                 # Parsing failed, but that's OK - just continue with raw display
@@ -711,8 +975,8 @@ class UARTCommandSenderGUI(QMainWindow):
     
     def closeEvent(self, event):
         """Handle application closing"""
-        if self.backend.is_connected:
-            self.backend.disconnect()
+        self.backend.shutdown()
+        self.port_scan_thread.wait()
         event.accept()
 
 